@@ -0,0 +1,76 @@
+"""Benchmarks for the algorithms in algorithmic.arrays.
+
+Usage:
+    python benchmarks/bench_arrays.py
+"""
+import random
+import timeit
+
+from algorithmic import arrays
+
+SIZES = [16, 64, 256, 1024, 2048]
+BLOCK_SIZES = [8, 16, 32, 64, 128]
+REPEAT = 3
+
+
+def square_matrix(n):
+    return [list(range(i * n, (i + 1) * n)) for i in range(n)]
+
+
+def best_time(func):
+    return min(timeit.Timer(func).repeat(repeat=REPEAT, number=1))
+
+
+def bench_rotate_matrix():
+    print("rotate_matrix (seconds per call)")
+    print(("{:>6}" + " {:>10}" * len(arrays.ROTATION_METHODS)).format(
+        "N", *arrays.ROTATION_METHODS))
+
+    for n in SIZES:
+        matrix = square_matrix(n)
+        times = [
+            best_time(lambda: arrays.rotate_matrix(matrix, method=method))
+            for method in arrays.ROTATION_METHODS
+        ]
+
+        print(("{:>6}" + " {:>10.6f}" * len(times)).format(n, *times))
+
+
+def bench_rotate_matrix_block_size():
+    print("rotate_matrix with tiles, by block size (seconds per call)")
+    print(("{:>6} {:>10}" + " {:>10}" * len(BLOCK_SIZES)).format("N", "layers", *BLOCK_SIZES))
+
+    for n in SIZES:
+        matrix = square_matrix(n)
+        times = [best_time(lambda: arrays.rotate_matrix(matrix, method='layers'))]
+        times.extend(
+            best_time(lambda: arrays.rotate_matrix(matrix, method='tiles', block_size=size))
+            for size in BLOCK_SIZES
+        )
+
+        print(("{:>6}" + " {:>10.6f}" * len(times)).format(n, *times))
+
+
+def bench_set_zeros():
+    print("set_zeros, with N zeros (seconds per call)")
+    print(("{:>6}" + " {:>10}" * len(arrays.ZEROS_METHODS)).format("N", *arrays.ZEROS_METHODS))
+
+    for n in SIZES:
+        matrix = square_matrix(n)
+        for _ in range(n):
+            matrix[random.randrange(n)][random.randrange(n)] = 0
+
+        times = [
+            best_time(lambda: arrays.set_zeros([row[:] for row in matrix], method=method))
+            for method in arrays.ZEROS_METHODS
+        ]
+
+        print(("{:>6}" + " {:>10.6f}" * len(times)).format(n, *times))
+
+
+if __name__ == '__main__':
+    bench_rotate_matrix()
+    print()
+    bench_rotate_matrix_block_size()
+    print()
+    bench_set_zeros()
@@ -0,0 +1,313 @@
+"""Benchmarks for the linked lists in algorithmic.llists.
+
+Usage:
+    python benchmarks/bench_llists.py
+"""
+import gc
+import random
+import sys
+import timeit
+import tracemalloc
+
+from algorithmic import llists
+
+SIZES = [10 ** 5, 10 ** 6, 10 ** 7]
+TRAVERSAL_SIZES = [10 ** 5, 10 ** 6]
+APPENDS = 10
+DIGITS = [10 ** 4, 10 ** 5, 10 ** 6]
+PALINDROME_SIZES = [10 ** 2, 10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6]
+DUPLICATES_SIZES = [10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6]
+DUPLICATES_RATE = 0.01
+RUNNER_MAX_SIZE = 10 ** 4
+LIST_COUNTS = [10, 100, 1000]
+LIST_LENGTH = 1000
+PAIRWISE_MAX_COUNT = 100
+REPEAT = 3
+
+
+class DictNode:
+    # Previous node, without __slots__.
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+
+
+class WalkingLinkedList:
+    # Previous implementation, which walks the whole list to find its size and tail.
+    def __init__(self, items):
+        self.head = DictNode(items[0])
+        tail = self.head
+        for item in items[1:]:
+            tail.next = DictNode(item)
+            tail = tail.next
+
+    def __len__(self):
+        i = 0
+        node = self.head
+        while node is not None:
+            node = node.next
+            i += 1
+
+        return i
+
+    def add_node(self, node):
+        tail = self.head
+        while tail.next is not None:
+            tail = tail.next
+
+        tail.next = node
+
+
+IMPLEMENTATIONS = [
+    ("walking", WalkingLinkedList, DictNode),
+    ("tracked", llists.LinkedList, llists.Node),
+    ("compact", llists.CompactLinkedList, llists.Node),
+    ("compact[q]", lambda items: llists.CompactLinkedList(items, typecode='q'), llists.Node),
+]
+
+
+def to_list(llist):
+    if hasattr(llist, 'tolist'):
+        return llist.tolist()
+
+    items = []
+    node = llist.head
+    while node is not None:
+        items.append(node.data)
+        node = node.next
+
+    return items
+
+
+def best_time(func, number=1):
+    return min(timeit.Timer(func).repeat(repeat=REPEAT, number=number)) / number
+
+
+def allocated_bytes(func):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = func()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    del result
+    return size
+
+
+def peak_bytes(func):
+    gc.collect()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak
+
+
+def bench_memory():
+    print("memory of a linked list of N integers (bytes per node)")
+    print(("{:>10}" + " {:>12}" * len(IMPLEMENTATIONS)).format(
+        "N", *(name for name, _, _ in IMPLEMENTATIONS)))
+
+    for n in SIZES:
+        items = list(range(n))
+        sizes = [allocated_bytes(lambda: cls(items)) for _, cls, _ in IMPLEMENTATIONS]
+
+        print(("{:>10}" + " {:>12.1f}" * len(sizes)).format(n, *(s / n for s in sizes)))
+
+
+def bench_throughput():
+    columns = ["build", "len", "add_node", "tolist"]
+
+    print("throughput of a linked list of N integers (operations per second)")
+    print(("{:>10} {:>10}" + " {:>14}" * len(columns)).format("N", "list", *columns))
+
+    for n in SIZES:
+        items = list(range(n))
+
+        for name, cls, node in IMPLEMENTATIONS:
+            llist = cls(items)
+            rates = [
+                n / best_time(lambda: cls(items)),
+                1 / best_time(lambda: len(llist)),
+                1 / best_time(lambda: llist.add_node(node(0)), number=APPENDS),
+                n / best_time(lambda: to_list(llist)),
+            ]
+
+            print(("{:>10} {:>10}" + " {:>14.0f}" * len(rates)).format(n, name, *rates))
+
+
+def iterate(llist):
+    for _ in llist:
+        pass
+
+
+def bench_traversal():
+    # The values are distinct, so remove_duplicates leaves the list unchanged between runs.
+    columns = {
+        "iterate": iterate,
+        "at": lambda llist: llist.at(len(llist) - 1),
+        "kth_to_last": lambda llist: llists.kth_to_last(llist, 1),
+        "is_palindrome": llists.is_palindrome,
+        "remove_dups": llists.remove_duplicates,
+        "reverse": lambda llist: llist.reverse(),
+        "tolist": lambda llist: llist.tolist(),
+    }
+
+    print("traversals of a linked list of N integers (seconds per call)")
+    print(("{:>10} {:>10}" + " {:>13}" * len(columns)).format("N", "list", *columns))
+
+    for n in TRAVERSAL_SIZES:
+        items = list(range(n))
+
+        for name, cls, _ in IMPLEMENTATIONS[1:]:
+            llist = cls(items)
+            times = [best_time(lambda: func(llist)) for func in columns.values()]
+
+            print(("{:>10} {:>10}" + " {:>13.4f}" * len(times)).format(n, name, *times))
+
+
+def sum_strings(l1, l2):
+    # Previous implementation of llists.sum, which converts the digits to str and int.
+    l1_int = int(''.join(map(str, l1.tolist()[::-1])))
+    l2_int = int(''.join(map(str, l2.tolist()[::-1])))
+
+    return llists.LinkedList([int(x) for x in str(l1_int + l2_int)][::-1])
+
+
+def limbs(digits):
+    # Groups decimal digits, in reversed order, into base 10^9 limbs.
+    return [
+        int(''.join(map(str, digits[i:i + 9][::-1])))
+        for i in range(0, len(digits), 9)
+    ]
+
+
+def bench_sum():
+    if hasattr(sys, 'set_int_max_str_digits'):
+        sys.set_int_max_str_digits(0)
+
+    columns = ["strings", "digits", "limbs"]
+
+    print("sum of two numbers of N decimal digits (seconds per call)")
+    print(("{:>10}" + " {:>12}" * len(columns)).format("N", *columns))
+
+    for n in DIGITS:
+        d1 = [random.randint(0, 9) for _ in range(n)]
+        d2 = [random.randint(0, 9) for _ in range(n)]
+
+        l1, l2 = llists.LinkedList(d1), llists.LinkedList(d2)
+        m1, m2 = llists.LinkedList(limbs(d1)), llists.LinkedList(limbs(d2))
+
+        times = [
+            best_time(lambda: sum_strings(l1, l2)),
+            best_time(lambda: llists.sum(l1, l2)),
+            best_time(lambda: llists.sum(m1, m2, base=llists.LIMB_BASE)),
+        ]
+
+        print(("{:>10}" + " {:>12.4f}" * len(times)).format(n, *times))
+
+
+def bench_is_palindrome():
+    methods = llists.PALINDROME_METHODS
+
+    print("is_palindrome over palindromes of N items (seconds per call / peak KB)")
+    print(("{:>10}" + " {:>18}" * len(methods)).format("N", *methods))
+
+    for n in PALINDROME_SIZES:
+        half = list(range(n // 2))
+        llist = llists.LinkedList(half + half[::-1])
+
+        cells = []
+        for method in methods:
+            try:
+                seconds = best_time(lambda: llists.is_palindrome(llist, method=method))
+                peak = peak_bytes(lambda: llists.is_palindrome(llist, method=method))
+            except RecursionError:
+                cells.append("recursion error")
+                continue
+
+            cells.append("{:.4f} / {:.0f}".format(seconds, peak / 1024))
+
+        print(("{:>10}" + " {:>18}" * len(cells)).format(n, *cells))
+
+
+def bench_remove_duplicates():
+    methods = llists.DUPLICATES_METHODS
+
+    print("remove_duplicates over N values, 1% duplicated (seconds / reported KB)")
+    print(("{:>10}" + " {:>18}" * len(methods)).format("N", *methods))
+
+    for n in DUPLICATES_SIZES:
+        items = list(range(n))
+        items += random.sample(items, int(n * DUPLICATES_RATE))
+        random.shuffle(items)
+
+        cells = []
+        for method in methods:
+            if method == 'runner' and n > RUNNER_MAX_SIZE:
+                cells.append("-")
+                continue
+
+            llist = llists.LinkedList(items)
+            start = timeit.default_timer()
+            memory = llists.remove_duplicates(llist, method=method, chunk_size=n // 10)
+            seconds = timeit.default_timer() - start
+
+            cells.append("{:.3f} / {:.0f}".format(seconds, memory / 1024))
+
+        print(("{:>10}" + " {:>18}" * len(cells)).format(n, *cells))
+
+
+def merged_lists(count, length):
+    # count lists of length nodes. Every other one merges into the first one, halfway.
+    lists = [llists.LinkedList(range(length)) for _ in range(count)]
+    for llist in lists[1::2]:
+        llist.add_node(lists[0].at(length // 2))
+
+    return lists
+
+
+def pairwise_intersections(lists):
+    return [
+        llists.intersection(l1, l2)
+        for i, l1 in enumerate(lists) for l2 in lists[i + 1:]
+    ]
+
+
+def bench_merge_points():
+    columns = ["pairwise", "merge_points"]
+
+    print("merge points among lists of {} nodes (seconds per call)".format(LIST_LENGTH))
+    print(("{:>10}" + " {:>14}" * len(columns)).format("lists", *columns))
+
+    for count in LIST_COUNTS:
+        lists = merged_lists(count, LIST_LENGTH)
+
+        pairwise = "-"
+        if count <= PAIRWISE_MAX_COUNT:
+            pairwise = "{:.4f}".format(best_time(lambda: pairwise_intersections(lists)))
+
+        bulk = "{:.4f}".format(best_time(lambda: llists.merge_points(lists)))
+
+        print(("{:>10}" + " {:>14}" * len(columns)).format(count, pairwise, bulk))
+
+
+if __name__ == '__main__':
+    bench_memory()
+    print()
+    bench_throughput()
+    print()
+    bench_traversal()
+    print()
+    bench_sum()
+    print()
+    bench_is_palindrome()
+    print()
+    bench_remove_duplicates()
+    print()
+    bench_merge_points()
@@ -0,0 +1,106 @@
+"""Benchmarks for the algorithms in algorithmic.strings.
+
+Usage:
+    python benchmarks/bench_strings.py
+"""
+import io
+import random
+import string
+import timeit
+
+from algorithmic import strings
+
+BATCH_SIZES = [1000, 10000, 100000]
+IDENTIFIER_LENGTH = 12
+REPEAT = 3
+
+ALPHABET = string.ascii_letters + string.digits + '_'
+
+TEXT_SIZES = [10 ** 6, 10 ** 7, 10 ** 8]
+
+
+def identifiers(n, length=IDENTIFIER_LENGTH):
+    return [''.join(random.choices(ALPHABET, k=length)) for _ in range(n)]
+
+
+def best_time(func):
+    return min(timeit.Timer(func).repeat(repeat=REPEAT, number=1))
+
+
+def bench_unique():
+    columns = strings.UNIQUE_METHODS + ['unique_many']
+
+    print("unique over a batch of identifiers (identifiers per second)")
+    print(("{:>8}" + " {:>12}" * len(columns)).format("N", *columns))
+
+    for n in BATCH_SIZES:
+        batch = identifiers(n)
+        times = [
+            best_time(lambda: [strings.unique(s, method=method) for s in batch])
+            for method in strings.UNIQUE_METHODS
+        ]
+        times.append(best_time(lambda: list(strings.unique_many(batch))))
+
+        print(("{:>8}" + " {:>12.0f}" * len(times)).format(n, *(n / t for t in times)))
+
+
+def palindrome_permutation_copies(string):
+    # Previous implementation, which copies the string twice and counts every character.
+    string = string.replace(" ", "")
+    string = string.lower()
+
+    occurrences = {k: 0 for k in set(string)}
+
+    for char in string:
+        occurrences[char] += 1
+
+    return sum(count % 2 for count in occurrences.values()) <= 1
+
+
+def bench_palindrome_permutation():
+    columns = ["copies", "single-pass", "stream"]
+
+    print("palindrome_permutation (seconds per call)")
+    print(("{:>10}" + " {:>12}" * len(columns)).format("N", *columns))
+
+    for n in TEXT_SIZES:
+        text = ''.join(random.choices(string.ascii_letters + ' ', k=n))
+        times = [
+            best_time(lambda: palindrome_permutation_copies(text)),
+            best_time(lambda: strings.palindrome_permutation(text)),
+            best_time(lambda: strings.palindrome_permutation(io.StringIO(text))),
+        ]
+
+        print(("{:>10}" + " {:>12.3f}" * len(times)).format(n, *times))
+
+
+def bench_rle():
+    columns = ["compression", "rle_encode", "rle_decode"]
+
+    print("run-length encoding, runs of 1 to 20 characters (MB per second)")
+    print(("{:>10}" + " {:>12}" * len(columns)).format("N", *columns))
+
+    for n in TEXT_SIZES[:-1]:
+        text = ''
+        while len(text) < n:
+            text += ''.join(c * random.randint(1, 20) for c in random.choices(ALPHABET, k=1000))
+
+        encoded = io.BytesIO()
+        strings.rle_encode(text, encoded)
+
+        times = [
+            best_time(lambda: strings.compression(text)),
+            best_time(lambda: strings.rle_encode(text, io.BytesIO())),
+            best_time(lambda: strings.rle_decode(encoded.getvalue(), io.StringIO(), text=True)),
+        ]
+
+        print(("{:>10}" + " {:>12.1f}" * len(times)).format(
+            len(text), *(len(text) / t / 10 ** 6 for t in times)))
+
+
+if __name__ == '__main__':
+    bench_unique()
+    print()
+    bench_palindrome_permutation()
+    print()
+    bench_rle()
@@ -0,0 +1,509 @@
+"""Measures the empirical time complexity of the algorithms and data structures.
+
+Each case times one operation over a sweep of input sizes N,
+    and fits the growth exponent k of time ~ N^k with a least squares fit in log-log space.
+The exponent is compared with the one predicted by the "Time: O(...)" claim
+    in the docstring of the function (or with an assumed claim, when there is none),
+    and the cases that disagree are flagged.
+
+Results can be stored as JSON, so that runs from different commits can be compared.
+
+Usage:
+    python benchmarks/complexity.py [--filter NAME] [--output FILE] [--compare FILE]
+"""
+import argparse
+import gc
+import io
+import json
+import math
+import platform
+import random
+import re
+import string
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from algorithmic import arrays
+from algorithmic import llists
+from algorithmic import queues
+from algorithmic import stacks
+from algorithmic import strings
+
+SIZES = [1000, 2000, 4000, 8000, 16000]
+SMALL_SIZES = [100, 200, 400, 800]
+SIDES = [64, 128, 256, 512]
+REPEAT = 5
+TOLERANCE = 0.35
+
+CLAIM_PATTERN = re.compile(r'Time:\s*O\((.*)\)\.?\s*$', re.MULTILINE)
+
+
+@dataclass
+class Case:
+    """An operation whose complexity is measured.
+
+    Args:
+        name: name of the case.
+        func: the function or method whose docstring documents the complexity.
+        setup: builds the state for an input of size N.
+        run: performs the operation once on the state.
+        sizes: the input sizes to sweep.
+        number: how many times the operation is run on each state (for cheap operations).
+        method: if the docstring documents several methods, the one used.
+        claim: the complexity to expect, if it is not documented, e.g., 'O(1)'.
+        constants: variables of the claim that don't grow with N, e.g., {'K': 1}.
+    """
+    name: str
+    func: Callable
+    setup: Callable[[int], Any]
+    run: Callable[[Any], Any]
+    sizes: List[int] = field(default_factory=lambda: SIZES)
+    number: int = 1
+    method: Optional[str] = None
+    claim: Optional[str] = None
+    constants: Dict[str, float] = field(default_factory=dict)
+
+
+def documented_claim(func: Callable, method: str = None) -> Optional[str]:
+    """Returns the time complexity documented in the docstring of a function, e.g., 'O(N)'.
+
+    If a method is provided, returns the complexity documented after the "- method:" line,
+        if there is one.
+    """
+    doc = func.__doc__ or ''
+
+    if method is not None:
+        start = doc.find('- {}:'.format(method))
+        if start != -1:
+            doc = doc[start:]
+
+    match = CLAIM_PATTERN.search(doc)
+    if match is None:
+        return None
+
+    return 'O({})'.format(match.group(1))
+
+
+def expected_exponent(claim: str, sizes: List[int], constants: Dict[str, float]) -> float:
+    """Returns the growth exponent predicted by a complexity claim over a sweep of sizes.
+
+    Every variable of the claim grows as N, except for the provided constants.
+        Logarithmic factors are evaluated, so 'O(N * log(N))' predicts a bit more than 1.
+    """
+    expression = claim[2:-1].replace('^', '**')
+    if '!' in expression:
+        return math.nan
+
+    names = set(re.findall(r'[A-Za-z_]\w*', expression)) - {'log'}
+
+    def growth(n):
+        variables = {name: constants.get(name, n) for name in names}
+        return eval(expression, {'log': math.log}, variables)
+
+    return fit_exponent(sizes, [growth(n) for n in sizes])
+
+
+def fit_exponent(sizes: List[int], times: List[float]) -> float:
+    """Fits the slope of log(time) against log(size) by least squares."""
+    xs = [math.log(n) for n in sizes]
+    ys = [math.log(max(t, 1e-12)) for t in times]
+
+    x_mean = sum(xs) / len(xs)
+    y_mean = sum(ys) / len(ys)
+
+    covariance = sum((x - x_mean) * (y - y_mean) for x, y in zip(xs, ys))
+    variance = sum((x - x_mean) ** 2 for x in xs)
+
+    return covariance / variance
+
+
+def measure(case: Case, n: int) -> float:
+    """Returns the best time, in seconds, of one run of the operation for size n."""
+    best = math.inf
+
+    for _ in range(REPEAT):
+        state = case.setup(n)
+
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            for _ in range(case.number):
+                case.run(state)
+            elapsed = time.perf_counter() - start
+        finally:
+            gc.enable()
+
+        best = min(best, elapsed)
+
+    return best / case.number
+
+
+def evaluate(case: Case) -> Dict[str, Any]:
+    """Measures a case and compares its growth with the claimed one."""
+    claim = documented_claim(case.func, case.method)
+    source = 'docstring'
+
+    if claim is None:
+        claim = case.claim
+        source = 'assumed'
+
+    times = [measure(case, n) for n in case.sizes]
+    measured = fit_exponent(case.sizes, times)
+    expected = expected_exponent(claim, case.sizes, case.constants) if claim else math.nan
+
+    if math.isnan(expected):
+        agrees = None
+    else:
+        agrees = abs(measured - expected) <= TOLERANCE
+
+    return {
+        'name': case.name,
+        'claim': claim,
+        'claim_source': source,
+        'sizes': case.sizes,
+        'times': times,
+        'expected_exponent': None if math.isnan(expected) else round(expected, 2),
+        'measured_exponent': round(measured, 2),
+        'agrees': agrees,
+    }
+
+
+# Inputs.
+
+def text(n, alphabet=string.ascii_lowercase):
+    return ''.join(random.choices(alphabet, k=n))
+
+
+def distinct_text(n):
+    return ''.join(chr(0x100 + i) for i in range(n))
+
+
+def palindrome(n):
+    half = text(n // 2)
+    return half + half[::-1]
+
+
+def square_matrix(n):
+    return [[random.randint(1, 9) for _ in range(n)] for _ in range(n)]
+
+
+def linked_list(n, alphabet=None):
+    items = random.choices(alphabet, k=n) if alphabet else list(range(n))
+    return llists.LinkedList(items)
+
+
+def skip_list(n):
+    llist = llists.LinkedList(range(n), skip_list=True)
+    llist.at(0)  # builds the skip list.
+    return llist
+
+
+def many_lists(n, count=100):
+    # count lists of n / count nodes, every other one merged into the first one.
+    lists = [linked_list(n // count) for _ in range(count)]
+    for llist in lists[1::2]:
+        llist.add_node(lists[0].at(n // count // 2))
+
+    return lists
+
+
+def full_stack(n, cls=stacks.Stack):
+    stack = cls(capacity=None)
+    for i in range(n):
+        stack.push(i)
+
+    return stack
+
+
+def full_set_of_stacks(n):
+    stack = stacks.SetOfStacks()
+    for i in range(n):
+        stack.push(i)
+
+    return stack
+
+
+def full_queue(n):
+    queue = queues.QueueWithStacks()
+    queue._s1 = stacks.Stack(capacity=None)
+    queue._s2 = stacks.Stack(capacity=None)
+
+    for i in range(n):
+        queue.push(i)
+
+    return queue
+
+
+def full_shelter(n):
+    shelter = queues.AnimalQueue()
+    for i in range(n):
+        shelter.enqueue(queues.Dog(name=str(i)) if i % 2 else queues.Cat(name=str(i)))
+
+    return shelter
+
+
+def merged_lists(n):
+    l1 = linked_list(n)
+    l2 = linked_list(n // 2)
+    l2.add_node(l1.at(n // 2))
+
+    return l1, l2
+
+
+def looped_list(n):
+    llist = linked_list(n)
+    llist.add_node(llist.at(n // 2))
+
+    return llist
+
+
+def encoded(data):
+    buffer = io.BytesIO()
+    strings.rle_encode(data, buffer)
+
+    return buffer.getvalue()
+
+
+CASES = [
+    # arrays.
+    *[
+        Case(f'arrays.rotate_matrix[{m}]', arrays.rotate_matrix, square_matrix,
+             lambda x, m=m: arrays.rotate_matrix(x, method=m), sizes=SIDES, method=m)
+        for m in arrays.ROTATION_METHODS
+    ],
+    *[
+        Case(f'arrays.set_zeros[{m}]', arrays.set_zeros, square_matrix,
+             lambda x, m=m: arrays.set_zeros(x, method=m), sizes=SIDES, method=m)
+        for m in arrays.ZEROS_METHODS
+    ],
+    Case('arrays.set_zeros_sparse', arrays.set_zeros_sparse,
+         lambda n: ({(i, i): 1 for i in range(n)}, (n, n)),
+         lambda x: arrays.set_zeros_sparse(*x)),
+
+    # strings.
+    *[
+        Case(f'strings.unique[{m}]', strings.unique, distinct_text,
+             lambda x, m=m: strings.unique(x, method=m, unicode=True), method=m,
+             claim='O(N)')
+        for m in strings.UNIQUE_METHODS
+    ],
+    Case('strings.unique_many', strings.unique_many,
+         lambda n: [text(8) for _ in range(n)], lambda x: list(strings.unique_many(x))),
+    *[
+        Case(f'strings.check_permutation[{m}]', strings.check_permutation,
+             lambda n: (text(n), text(n)), lambda x, m=m: strings.check_permutation(*x, method=m),
+             method=m)
+        for m in strings.PERMUTATION_METHODS
+    ],
+    Case('strings.signature', strings.signature, text, strings.signature),
+    Case('strings.urlify', strings.urlify,
+         lambda n: (bytearray((text(n, ' ab') + ' ' * 2 * n).encode()), n),
+         lambda x: strings.urlify(*x)),
+    Case('strings.percent_encode', strings.percent_encode,
+         lambda n: text(n, ' ab').encode(), lambda x: list(strings.percent_encode(x))),
+    Case('strings.percent_decode', strings.percent_decode,
+         lambda n: text(n, '%20ab').encode(), lambda x: list(strings.percent_decode(x))),
+    Case('strings.next_permutation', strings.next_permutation,
+         lambda n: sorted(text(n), reverse=True), strings.next_permutation),
+    Case('strings.count_permutations', strings.count_permutations,
+         lambda n: text(n, 'ab'), strings.count_permutations, sizes=SMALL_SIZES),
+    Case('strings.rank', strings.rank, lambda n: text(n, 'ab'), strings.rank,
+         sizes=SMALL_SIZES, constants={'A': 2}),
+    Case('strings.unrank', strings.unrank, lambda n: text(n, 'ab'),
+         lambda x: strings.unrank(x, 1), sizes=SMALL_SIZES, constants={'A': 2}),
+    Case('strings.palindrome_permutation', strings.palindrome_permutation,
+         lambda n: text(n * 10), strings.palindrome_permutation, constants={'A': 26, 'C': 1}),
+    Case('strings.is_palindrome', strings.is_palindrome, palindrome, strings.is_palindrome),
+    Case('strings.longest_palindromic_substring', strings.longest_palindromic_substring,
+         text, strings.longest_palindromic_substring),
+    Case('strings.count_palindromic_substrings', strings.count_palindromic_substrings,
+         text, strings.count_palindromic_substrings),
+    Case('strings.one_away', strings.one_away, lambda n: (text(n), text(n)),
+         lambda x: strings.one_away(x[0], x[0] + 'a')),
+    Case('strings.edit_distance', strings.edit_distance,
+         lambda n: (text(n), text(n)), lambda x: strings.edit_distance(*x), sizes=SMALL_SIZES),
+    Case('strings.within_k_edits', strings.within_k_edits,
+         lambda n: text(n), lambda x: strings.within_k_edits(x, x[1:] + 'a', 2),
+         constants={'K': 2}),
+    Case('strings.compression', strings.compression, text, strings.compression),
+    Case('strings.rle_encode', strings.rle_encode, text,
+         lambda x: strings.rle_encode(x, io.BytesIO()), constants={'C': 1}),
+    Case('strings.rle_decode', strings.rle_decode, lambda n: encoded(text(n)),
+         lambda x: strings.rle_decode(x, io.BytesIO()), constants={'C': 1}),
+    Case('strings.rotation', strings.rotation, lambda n: (text(n), text(n)),
+         lambda x: strings.rotation(x[0], x[0][7:] + x[0][:7])),
+    Case('strings.minimal_rotation', strings.minimal_rotation, text, strings.minimal_rotation),
+    Case('strings.group_rotations', strings.group_rotations,
+         lambda n: [text(8) for _ in range(n)], strings.group_rotations),
+
+    # linked lists.
+    Case('llists.LinkedList', llists.LinkedList, lambda n: list(range(n)), llists.LinkedList,
+         claim='O(N)'),
+    Case('llists.LinkedList.__len__', llists.LinkedList.__len__, linked_list, len,
+         number=1000),
+    Case('llists.LinkedList.tolist', llists.LinkedList.tolist, linked_list,
+         llists.LinkedList.tolist, claim='O(N)'),
+    Case('llists.LinkedList.add_node', llists.LinkedList.add_node, linked_list,
+         lambda x: x.add_node(llists.Node(0)), number=1000, constants={'K': 1}),
+    Case('llists.LinkedList.get_last', llists.LinkedList.get_last, linked_list,
+         llists.LinkedList.get_last, number=1000),
+    Case('llists.LinkedList.get_node', llists.LinkedList.get_node, linked_list,
+         lambda x: x.get_node(len(x) - 1), claim='O(N)'),
+    Case('llists.LinkedList.get_node[indexed]', llists.LinkedList.get_node,
+         lambda n: llists.LinkedList(range(n), indexed=True),
+         lambda x: x.get_node(len(x) - 1), number=100, claim='O(1)'),
+    Case('llists.LinkedList.at', llists.LinkedList.at, linked_list,
+         lambda x: x.at(len(x) - 1), claim='O(N)'),
+    Case('llists.LinkedList.at[skip_list]', llists.LinkedList.at, skip_list,
+         lambda x: x.at(len(x) - 1), number=100, claim='O(log(N))'),
+    Case('llists.LinkedList.insert[skip_list]', llists.LinkedList.insert, skip_list,
+         lambda x: x.insert(len(x) // 2, 0), number=100, claim='O(log(N))'),
+    Case('llists.LinkedList.delete[skip_list]', llists.LinkedList.delete, skip_list,
+         lambda x: x.delete(len(x) // 2), number=100, claim='O(log(N))'),
+    Case('llists.LinkedList.reverse', llists.LinkedList.reverse, linked_list,
+         llists.LinkedList.reverse),
+    Case('llists.remove_duplicates', llists.remove_duplicates,
+         lambda n: linked_list(n, alphabet=range(100)), llists.remove_duplicates),
+    Case('llists.kth_to_last', llists.kth_to_last, linked_list,
+         lambda x: llists.kth_to_last(x, k=1)),
+    Case('llists.kth_to_last_recursive', llists.kth_to_last_recursive,
+         lambda n: linked_list(n).head, lambda x: llists.kth_to_last_recursive(x, k=1),
+         sizes=SMALL_SIZES),
+    Case('llists.delete_middle_node', llists.delete_middle_node,
+         linked_list, lambda x: llists.delete_middle_node(x.head, x), number=100),
+    Case('llists.partition', llists.partition, linked_list,
+         lambda x: llists.partition(x, len(x) // 2)),
+    Case('llists.sum', llists.sum,
+         lambda n: (linked_list(n, range(10)), linked_list(n, range(10))),
+         lambda x: llists.sum(*x)),
+    Case('llists.sum[forward]', llists.sum,
+         lambda n: (linked_list(n, range(10)), linked_list(n, range(10))),
+         lambda x: llists.sum(*x, reverse=False)),
+    *[
+        Case(f'llists.is_palindrome[{m}]', llists.is_palindrome,
+             lambda n: llists.LinkedList(palindrome(n)),
+             lambda x, m=m: llists.is_palindrome(x, method=m), method=m,
+             sizes=SMALL_SIZES if m in ['reverse', 'recursive'] else SIZES)
+        for m in llists.PALINDROME_METHODS
+    ],
+    Case('llists.intersection', llists.intersection, merged_lists,
+         lambda x: llists.intersection(*x), claim='O(N)'),
+    Case('llists.merge_points', llists.merge_points, many_lists, llists.merge_points),
+    Case('llists.loop_detection', llists.loop_detection, looped_list, llists.loop_detection),
+
+    # stacks.
+    Case('stacks.Stack.push', stacks.Stack.push, full_stack,
+         lambda x: x.push(0), number=100),
+    Case('stacks.Stack.pop', stacks.Stack.pop, lambda n: full_stack(n + 100),
+         stacks.Stack.pop, number=100),
+    Case('stacks.Stack.peek', stacks.Stack.peek, full_stack, stacks.Stack.peek, number=100),
+    Case('stacks.Stack.__len__', stacks.Stack.__len__, full_stack, len, claim='O(1)'),
+    Case('stacks.Stack.tolist', stacks.Stack.tolist, full_stack, stacks.Stack.tolist),
+    Case('stacks.Stack.pop_bottom', stacks.Stack.pop_bottom, full_stack,
+         stacks.Stack.pop_bottom, sizes=SMALL_SIZES),
+    Case('stacks.StackMin.push', stacks.StackMin.push,
+         lambda n: full_stack(n, stacks.StackMin), lambda x: x.push(0), number=100),
+    Case('stacks.StackMin.min', stacks.StackMin.min,
+         lambda n: full_stack(n, stacks.StackMin), stacks.StackMin.min, number=100),
+    Case('stacks.SetOfStacks.push', stacks.SetOfStacks.push, full_set_of_stacks,
+         lambda x: x.push(0), number=100),
+    Case('stacks.SetOfStacks.pop', stacks.SetOfStacks.pop,
+         lambda n: full_set_of_stacks(n + 100), stacks.SetOfStacks.pop, number=100),
+    Case('stacks.SetOfStacks.pop_at', stacks.SetOfStacks.pop_at, full_set_of_stacks,
+         lambda x: x.pop_at(0)),
+    Case('stacks.SetOfStacks.__len__', stacks.SetOfStacks.__len__, full_set_of_stacks, len,
+         claim='O(1)'),
+
+    # queues.
+    Case('queues.QueueWithStacks.push', queues.QueueWithStacks.push, full_queue,
+         lambda x: x.push(0), number=100, claim='O(1)'),
+    Case('queues.QueueWithStacks.peek', queues.QueueWithStacks.peek, full_queue,
+         queues.QueueWithStacks.peek),
+    Case('queues.QueueWithStacks.pop', queues.QueueWithStacks.pop, full_queue,
+         queues.QueueWithStacks.pop),
+    Case('queues.QueueWithStacks.__len__', queues.QueueWithStacks.__len__, full_queue, len,
+         claim='O(1)'),
+    Case('queues.AnimalQueue.enqueue', queues.AnimalQueue.enqueue, full_shelter,
+         lambda x: x.enqueue(queues.Dog(name='dog')), number=100),
+    Case('queues.AnimalQueue.dequeueAny', queues.AnimalQueue.dequeueAny,
+         lambda n: full_shelter(n + 100), queues.AnimalQueue.dequeueAny, number=100),
+]
+
+
+def compare(previous: Dict[str, Any], current: Dict[str, Any]) -> None:
+    """Prints the change in measured exponent and time at the biggest size, per case."""
+    before = {result['name']: result for result in previous['results']}
+
+    print("\n{:<45} {:>9} {:>9} {:>9}".format("case", "exp. was", "exp. now", "time x"))
+    for result in current['results']:
+        old = before.get(result['name'])
+        if old is None or old['sizes'] != result['sizes']:
+            continue
+
+        print("{:<45} {:>9.2f} {:>9.2f} {:>9.2f}".format(
+            result['name'], old['measured_exponent'], result['measured_exponent'],
+            result['times'][-1] / old['times'][-1]))
+
+
+def commit() -> Optional[str]:
+    try:
+        output = subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    return output.stdout.strip()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--filter', default='', help="only run cases containing this text.")
+    parser.add_argument('--output', help="file where to store the results as JSON.")
+    parser.add_argument('--compare', help="JSON file from a previous run to compare with.")
+    args = parser.parse_args(argv)
+
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 10 * max(SMALL_SIZES)))
+    random.seed(0)
+
+    print("{:<45} {:>16} {:>9} {:>9}".format("case", "claim", "expected", "measured"))
+
+    results = []
+    for case in CASES:
+        if args.filter not in case.name:
+            continue
+
+        result = evaluate(case)
+        results.append(result)
+
+        flag = {True: '', False: '  <-- disagrees', None: '  (not checked)'}[result['agrees']]
+        claim = result['claim'] or '-'
+        if result['claim_source'] == 'assumed':
+            claim += '*'
+
+        expected = result['expected_exponent']
+        print("{:<45} {:>16} {:>9} {:>9.2f}{}".format(
+            result['name'], claim, '-' if expected is None else '{:.2f}'.format(expected),
+            result['measured_exponent'], flag))
+
+    print("\n* not documented, assumed.")
+
+    report = {
+        'commit': commit(),
+        'python': platform.python_version(),
+        'results': results,
+    }
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(json.load(f), report)
+
+
+if __name__ == '__main__':
+    main()
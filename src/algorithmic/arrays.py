@@ -1,16 +1,68 @@
-from typing import List
+import math
+from typing import Any, Dict, List, Tuple
 
+ROTATION_METHODS = ['layers', 'zip', 'tiles']
+ZEROS_METHODS = ['markers', 'scan']
 
-def rotate_matrix(matrix: List[List]) -> None:
-    """Rotates a matrix (in-place) 90 degrees clock-wise.
+L1_CACHE_SIZE = 32 * 1024
+POINTER_SIZE = 8
 
-    Complexity:
-    - Time: O(N^2).
-    - Space: O(1).
+
+def rotate_matrix(
+    matrix: List[List], k: int = 1, method: str = 'layers', block_size: int = None
+) -> None:
+    """Rotates a matrix (in-place) k times 90 degrees clock-wise.
+
+    A negative k rotates the matrix counter clock-wise.
+
+    Methods:
+    - layers: swaps the four sides of each layer, element by element.
+        Only square matrices are supported.
+        - Time: O(N^2).
+        - Space: O(1).
+    - zip: rebuilds the rows with zip(), which iterates the columns in C.
+        Supports MxN matrices, in which case the shape of the matrix changes to NxM.
+        - Time: O(M * N).
+        - Space: O(M * N).
+    - tiles: copies the matrix into a rotated one, block by block,
+        so that both the source and destination blocks stay in the CPU cache.
+        Supports MxN matrices, like the zip method.
+        - Time: O(M * N).
+        - Space: O(M * N).
+
+    In all cases the outer list is modified in-place,
+        but the zip and tiles methods replace the row lists with new ones.
+
+    Args:
+        matrix: the matrix to rotate.
+        k: number of 90 degrees clock-wise turns.
+        method: the algorithm to use. One of ROTATION_METHODS.
+        block_size: side of the blocks used by the tiles method.
+            If not provided, it is chosen so that two blocks fit in the L1 cache.
     """
+    if method not in ROTATION_METHODS:
+        raise ValueError("Method {} not valid. Choose from {}".format(method, ROTATION_METHODS))
+
+    turns = k % 4
+
+    if not matrix or turns == 0:
+        return
+
+    if method == 'zip':
+        matrix[:] = _rotate_zip(matrix, turns)
+        return
+
+    if method == 'tiles':
+        matrix[:] = _rotate_tiles(matrix, turns, block_size or default_block_size())
+        return
+
     if len(matrix) != len(matrix[0]):
         raise ValueError("Input matrix must be square.")
 
+    _rotate_layers(matrix, turns)
+
+
+def _rotate_layers(matrix: List[List], turns: int) -> None:
     n = len(matrix)
 
     for layer in range(n // 2):
@@ -18,25 +70,107 @@ def rotate_matrix(matrix: List[List]) -> None:
         end = n - 1 - layer
         for i in range(start, end):
             offset = i - start
+
             top = matrix[start][i]
+            right = matrix[i][end]
+            bottom = matrix[end][end - offset]
+            left = matrix[end - offset][start]
+
+            if turns == 1:
+                top, right, bottom, left = left, top, right, bottom
+            elif turns == 2:
+                top, right, bottom, left = bottom, left, top, right
+            else:
+                top, right, bottom, left = right, bottom, left, top
+
+            matrix[start][i] = top
+            matrix[i][end] = right
+            matrix[end][end - offset] = bottom
+            matrix[end - offset][start] = left
+
 
-            matrix[start][i] = matrix[end - offset][start]
-            matrix[end - offset][start] = matrix[end][end - offset]
-            matrix[end][end - offset] = matrix[i][end]
-            matrix[i][end] = top
+def _rotate_zip(matrix: List[List], turns: int) -> List[List]:
+    if turns == 1:
+        return [list(column) for column in zip(*reversed(matrix))]
 
+    if turns == 2:
+        return [row[::-1] for row in reversed(matrix)]
 
-def set_zeros(matrix: List[List]) -> None:
+    return [list(column) for column in zip(*matrix)][::-1]
+
+
+def _rotate_tiles(matrix: List[List], turns: int, block_size: int) -> List[List]:
+    m = len(matrix)
+    n = len(matrix[0])
+
+    if turns == 2:
+        return [row[::-1] for row in reversed(matrix)]  # rows are already traversed in order.
+
+    rotated = [[None] * m for _ in range(n)]
+
+    for i_start in range(0, m, block_size):
+        i_stop = min(i_start + block_size, m)
+        for j_start in range(0, n, block_size):
+            j_stop = min(j_start + block_size, n)
+            for i in range(i_start, i_stop):
+                row = matrix[i]
+                if turns == 1:
+                    column = m - 1 - i
+                    for j in range(j_start, j_stop):
+                        rotated[j][column] = row[j]
+                else:
+                    for j in range(j_start, j_stop):
+                        rotated[n - 1 - j][i] = row[j]
+
+    return rotated
+
+
+def default_block_size(cache_size: int = L1_CACHE_SIZE) -> int:
+    """Returns the biggest power of two B such that two BxB blocks of pointers fit in the cache.
+
+    Args:
+        cache_size: the size of the cache in bytes.
+    """
+    side = math.isqrt(cache_size // (2 * POINTER_SIZE))
+
+    return 2 ** (side.bit_length() - 1)
+
+
+def set_zeros(matrix: List[List], method: str = 'markers') -> Tuple[List[int], List[int]]:
     """Modifies a matrix (in-place), so that if an element of it is zero,
         its entire row and column are set to zero.
 
-    Complexity:
-    - Time: O(N^2).
-    - Space: O(1).
+    Methods:
+    - markers: uses the first row and column to mark which columns and rows must be nullified.
+        - Time: O(N^2).
+        - Space: O(1).
+    - scan: finds the rows with zeros with the "in" operator, which scans each row in C,
+        and only inspects cell by cell the rows that contain zeros.
+        - Time: O(N^2).
+        - Space: O(N).
+
+    Args:
+        matrix: the matrix to modify.
+        method: the algorithm to use. One of ZEROS_METHODS.
+
+    Returns:
+        the indices of the nullified rows and columns, in ascending order.
     """
+    if method not in ZEROS_METHODS:
+        raise ValueError("Method {} not valid. Choose from {}".format(method, ZEROS_METHODS))
 
+    if not matrix:
+        return [], []
+
+    if method == 'scan':
+        return _set_zeros_scan(matrix)
+
+    return _set_zeros_markers(matrix)
+
+
+def _set_zeros_markers(matrix: List[List]) -> Tuple[List[int], List[int]]:
     def nullify_row(matrix, i):
-        matrix[i] = [0 for _ in matrix[i]]
+        matrix[i] = [0] * len(matrix[i])
 
     def nullify_column(matrix, j):
         for row in matrix:
@@ -50,7 +184,7 @@ def set_zeros(matrix: List[List]) -> None:
         return False
 
     first_row_has_zero = contains_zero(matrix[0])
-    first_column_has_zero = contains_zero([row[0] for row in matrix])
+    first_column_has_zero = contains_zero(row[0] for row in matrix)
 
     # We use first row and first column to reference which rows and columns must be nullified.
     # This way we can reach O(1) space.
@@ -60,6 +194,15 @@ def set_zeros(matrix: List[List]) -> None:
                 matrix[i][0] = 0
                 matrix[0][j] = 0
 
+    rows = [i for i, row in enumerate(matrix[1:], 1) if row[0] == 0]
+    columns = [j for j, cell in enumerate(matrix[0][1:], 1) if cell == 0]
+
+    if first_row_has_zero:
+        rows.insert(0, 0)
+
+    if first_column_has_zero:
+        columns.insert(0, 0)
+
     # Nullify rows in the rest of the matrix based on the values in the first column
     for i, row in enumerate(matrix[1:], 1):
         if row[0] == 0:
@@ -75,3 +218,72 @@ def set_zeros(matrix: List[List]) -> None:
 
     if first_column_has_zero:
         nullify_column(matrix, 0)
+
+    return rows, columns
+
+
+def _set_zeros_scan(matrix: List[List]) -> Tuple[List[int], List[int]]:
+    rows = [i for i, row in enumerate(matrix) if 0 in row]
+
+    columns = set()
+    for i in rows:
+        columns.update(j for j, cell in enumerate(matrix[i]) if cell == 0)
+
+    columns = sorted(columns)
+    zero_rows = set(rows)
+
+    for i, row in enumerate(matrix):
+        if i in zero_rows:
+            matrix[i] = [0] * len(row)
+        else:
+            for j in columns:
+                row[j] = 0
+
+    return rows, columns
+
+
+def set_zeros_sparse(
+    matrix: Dict[Tuple[int, int], Any], shape: Tuple[int, int]
+) -> Tuple[List[int], List[int]]:
+    """Modifies a sparse matrix (in-place), so that if an element of it is zero,
+        its entire row and column are set to zero.
+
+    The matrix is represented as a dictionary of keys, i.e., {(i, j): value},
+        where missing keys are zeros. A matrix in coordinate format [(i, j, value), ...]
+        can be converted with {(i, j): value for i, j, value in coordinates}.
+
+    Only the rows and columns that store a non-zero value in every cell survive,
+        so the algorithm just needs to count the non-zero values of each row and column.
+    Nullified values are removed from the dictionary.
+
+    Complexity:
+    - Time: O(Z + M + N).
+    - Space: O(Z + M + N).
+
+    Where Z is the number of stored values and M, N the dimensions of the matrix.
+
+    Args:
+        matrix: the matrix to modify.
+        shape: the number of rows and columns of the matrix.
+
+    Returns:
+        the indices of the nullified rows and columns, in ascending order.
+    """
+    m, n = shape
+
+    row_counts = [0] * m
+    column_counts = [0] * n
+
+    for (i, j), value in matrix.items():
+        if value != 0:
+            row_counts[i] += 1
+            column_counts[j] += 1
+
+    rows = [i for i, count in enumerate(row_counts) if count < n]
+    columns = [j for j, count in enumerate(column_counts) if count < m]
+
+    for i, j in list(matrix):
+        if row_counts[i] < n or column_counts[j] < m:
+            del matrix[i, j]
+
+    return rows, columns
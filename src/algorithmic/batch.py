@@ -0,0 +1,98 @@
+"""Runs functions over big batches of inputs in a pool of processes.
+
+The inputs are split into chunks that are sent to the workers,
+    and the results are returned in the same order as the inputs.
+Only a bounded number of chunks is in flight at any time,
+    so inputs can be consumed lazily from generators or files.
+
+The functions must be picklable, e.g., module level functions like algorithmic.strings.unique.
+"""
+import os
+import itertools
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Generator, Iterable, List
+
+DEFAULT_CHUNK_SIZE = 10000
+CHUNKS_PER_WORKER = 2
+
+
+def map(
+    func: Callable,
+    items: Iterable,
+    workers: int = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Generator[Any, None, None]:
+    """Applies a function to every item of an iterable, in a pool of processes.
+
+    Complexity:
+    - Space: O(W * C).
+
+    Where W is the number of workers and C the chunk size.
+
+    Args:
+        func: the function to apply.
+        items: the inputs. Any iterable, e.g., a list, a generator or a file object
+            (whose lines keep their trailing newline).
+        workers: the number of processes. Defaults to the number of CPUs.
+        chunk_size: the number of items sent to a worker at once.
+
+    Returns:
+        generator for the results, in the same order as the items.
+    """
+    return _run(_apply, func, items, workers, chunk_size)
+
+
+def starmap(
+    func: Callable,
+    items: Iterable[Iterable],
+    workers: int = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Generator[Any, None, None]:
+    """Like map, but each item is unpacked as the arguments of the function,
+        e.g., to run algorithmic.strings.one_away over pairs of strings.
+    """
+    return _run(_apply_unpacked, func, items, workers, chunk_size)
+
+
+def chunks(items: Iterable, chunk_size: int) -> Generator[List, None, None]:
+    """Splits an iterable into lists of chunk_size items (the last one may be shorter)."""
+    iterator = iter(items)
+
+    chunk = list(itertools.islice(iterator, chunk_size))
+    while chunk:
+        yield chunk
+        chunk = list(itertools.islice(iterator, chunk_size))
+
+
+def _run(
+    apply: Callable, func: Callable, items: Iterable, workers: int, chunk_size: int
+) -> Generator[Any, None, None]:
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive, got {}".format(chunk_size))
+
+    workers = workers or os.cpu_count() or 1
+    max_pending = workers * CHUNKS_PER_WORKER
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        try:
+            for chunk in chunks(items, chunk_size):
+                pending.append(executor.submit(apply, func, chunk))
+
+                if len(pending) >= max_pending:
+                    yield from pending.popleft().result()
+
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _apply(func: Callable, chunk: List) -> List:
+    return [func(item) for item in chunk]
+
+
+def _apply_unpacked(func: Callable, chunk: List) -> List:
+    return [func(*args) for args in chunk]
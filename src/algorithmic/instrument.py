@@ -0,0 +1,162 @@
+"""Opt-in operation counters for the linked lists, stacks and queues.
+
+When enabled, the methods of the data structures are replaced by wrappers that count their calls,
+    and the next attribute of the nodes by a descriptor that counts how many times it is read,
+    i.e., how many node traversals happen. When disabled, the original methods and attributes are
+    restored, so the counters have no overhead at all unless they are being used.
+
+    >>> with instrument.instrumented() as counters:
+    ...     queue.pop()
+    >>> counters.snapshot()
+    {'queues.QueueWithStacks.pop': 1, 'queues.QueueWithStacks.transfers': 18, ...}
+"""
+import sys
+from collections import Counter
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator
+
+from algorithmic import llists
+from algorithmic import queues
+from algorithmic import stacks
+
+COUNTERS = Counter()
+
+# (class, method, counter). Each call to the method increments the counter by one.
+CALLS = [
+    (llists.Node, '__init__', 'llists.Node.allocations'),
+    (llists.LinkedList, '__len__', 'llists.LinkedList.__len__'),
+    (stacks.Node, '__init__', 'stacks.Node.allocations'),
+    (stacks.Stack, 'push', 'stacks.Stack.push'),
+    (stacks.Stack, 'pop', 'stacks.Stack.pop'),
+    (stacks.Stack, '__len__', 'stacks.Stack.__len__'),
+    (stacks.StackMin, 'push', 'stacks.StackMin.push'),
+    (stacks.SetOfStacks, 'push', 'stacks.SetOfStacks.push'),
+    (stacks.SetOfStacks, 'pop', 'stacks.SetOfStacks.pop'),
+    (stacks.SetOfStacks, 'pop_at', 'stacks.SetOfStacks.pop_at'),
+    (stacks.SetOfStacks, '__len__', 'stacks.SetOfStacks.__len__'),
+    (queues.QueueWithStacks, 'push', 'queues.QueueWithStacks.push'),
+    (queues.QueueWithStacks, 'peek', 'queues.QueueWithStacks.peek'),
+    (queues.QueueWithStacks, 'pop', 'queues.QueueWithStacks.pop'),
+    (queues.QueueWithStacks, '__len__', 'queues.QueueWithStacks.__len__'),
+    (queues.AnimalQueue, 'enqueue', 'queues.AnimalQueue.enqueue'),
+    (queues.AnimalQueue, 'dequeueAny', 'queues.AnimalQueue.dequeueAny'),
+    (queues.AnimalQueue, 'dequeue_dog', 'queues.AnimalQueue.dequeue_dog'),
+    (queues.AnimalQueue, 'dequeue_cat', 'queues.AnimalQueue.dequeue_cat'),
+]
+
+# (class, attribute, counter). Each read of the attribute increments the counter by one.
+READS = [
+    (llists.Node, 'next', 'llists.Node.traversals'),
+    (llists.CompactNode, 'next', 'llists.CompactNode.traversals'),
+    (stacks.Node, 'next', 'stacks.Node.traversals'),
+]
+
+# (class, method, counter, amount). Each call increments the counter by amount(self).
+TRANSFERS = [
+    (queues.QueueWithStacks, '_s1_to_s2', 'queues.QueueWithStacks.transfers',
+        lambda queue: queue._s1._current_capacity),
+    (queues.QueueWithStacks, '_s2_to_s1', 'queues.QueueWithStacks.transfers',
+        lambda queue: queue._s2._current_capacity),
+]
+
+_originals = []
+
+
+class _CountedAttribute:
+    """Descriptor that counts the reads of an attribute, stored either in the instance
+        dictionary or in a slot (the original descriptor)."""
+    def __init__(self, name: str, counter: str, original: Any) -> None:
+        self.name = name
+        self.counter = counter
+        self.original = original
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+
+        COUNTERS[self.counter] += 1
+
+        if self.original is not None:
+            return self.original.__get__(instance, owner)
+
+        try:
+            return instance.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+
+    def __set__(self, instance, value) -> None:
+        if self.original is not None:
+            self.original.__set__(instance, value)
+        else:
+            instance.__dict__[self.name] = value
+
+
+def enable() -> None:
+    """Starts counting operations. Does nothing if already enabled."""
+    if is_enabled():
+        return
+
+    for cls, name, counter in CALLS:
+        _patch(cls, name, _counted_calls(getattr(cls, name), counter, lambda self: 1))
+
+    for cls, name, counter, amount in TRANSFERS:
+        _patch(cls, name, _counted_calls(getattr(cls, name), counter, amount))
+
+    for cls, name, counter in READS:
+        _patch(cls, name, _CountedAttribute(name, counter, cls.__dict__.get(name)))
+
+
+def disable() -> None:
+    """Stops counting operations and restores the original methods and attributes.
+        The counters keep their values until reset."""
+    while _originals:
+        cls, name, original = _originals.pop()
+        if original is None:
+            delattr(cls, name)
+        else:
+            setattr(cls, name, original)
+
+
+def is_enabled() -> bool:
+    """Checks if the operations are being counted."""
+    return bool(_originals)
+
+
+def reset() -> None:
+    """Sets all the counters to zero."""
+    COUNTERS.clear()
+
+
+def snapshot() -> Dict[str, int]:
+    """Returns a copy of the counters that are not zero."""
+    return {counter: count for counter, count in sorted(COUNTERS.items()) if count}
+
+
+@contextmanager
+def instrumented() -> Iterator[Any]:
+    """Counts the operations done inside a with block, starting from zero.
+
+    Yields this module, so that its snapshot function can be called
+        inside or after the block.
+    """
+    reset()
+    enable()
+    try:
+        yield sys.modules[__name__]
+    finally:
+        disable()
+
+
+def _patch(cls: type, name: str, replacement: Any) -> None:
+    _originals.append((cls, name, cls.__dict__.get(name)))
+    setattr(cls, name, replacement)
+
+
+def _counted_calls(method: Callable, counter: str, amount: Callable) -> Callable:
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        COUNTERS[counter] += amount(self)
+        return method(self, *args, **kwargs)
+
+    return wrapper
@@ -1,5 +1,29 @@
+import builtins
 import copy
-from typing import List, Any, Tuple
+import heapq
+import itertools
+import math
+import pickle
+import random
+import sys
+import tempfile
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, Generator, Iterable, List, Any, Tuple
+from weakref import WeakValueDictionary
+
+NULL_INDEX = -1
+
+LIMB_BASE = 10 ** 9
+
+PALINDROME_METHODS = ['halves', 'reverse', 'iterative', 'recursive']
+
+DUPLICATES_METHODS = ['set', 'runner', 'bloom', 'external']
+BLOOM_ERROR_RATE = 0.01
+EXTERNAL_CHUNK_SIZE = 10 ** 6
+
+SKIP_LIST_PROBABILITY = 0.25
+SKIP_LIST_MAX_LANES = 32
 
 
 class Node:
@@ -8,27 +32,196 @@ class Node:
     Args:
         data: the data to save in the node.
     """
+    __slots__ = ('data', 'next')
+
     def __init__(self, data: Any):
         self.data = data
         self.next = None
 
     def __repr__(self):
-        return self.data
+        return str(self.data)
+
+
+class _Skip:
+    """An entry of an express lane of a _SkipList."""
+    __slots__ = ('node', 'next', 'down', 'width')
+
+    def __init__(self, node: Node, width: int, down: '_Skip' = None):
+        self.node = node
+        self.next = None
+        self.down = down
+        self.width = width
+
+
+class _SkipList:
+    """Express lanes over the nodes of a linked list, to find nodes by position.
+
+    Each node of the list is in the lowest lane with probability SKIP_LIST_PROBABILITY,
+        in the lane above with the square of it, and so on. Each entry points to the next entry
+        of its lane, and to the entry of the same node in the lane below. Its width is the
+        number of positions up to the next entry (or up to the end of the list, for the last).
+
+    The first entry of each lane is a sentinel, before the head of the list (at position -1).
+    """
+    def __init__(self):
+        self.heads = []
+        self.tails = []
+
+    @classmethod
+    def build(cls, head: Node) -> '_SkipList':
+        lanes = cls()
+
+        position, node = 0, head
+        while node is not None:
+            lanes.append(node, position)
+            position, node = position + 1, node.next
+
+        return lanes
+
+    def locate(self, idx: int, head: Node) -> Node:
+        """Returns the node at position idx, which must be in bounds."""
+        position, entry = -1, self.heads[-1] if self.heads else None
+
+        while entry is not None:
+            while entry.next is not None and position + entry.width <= idx:
+                position += entry.width
+                entry = entry.next
+
+            if entry.down is None:
+                break
+
+            entry = entry.down
+
+        node = head
+        if position >= 0:
+            node = entry.node
+        else:
+            position = 0
+
+        for _ in range(idx - position):
+            node = node.next
+
+        return node
+
+    def append(self, node: Node, size: int) -> None:
+        """Adds the node appended at the end of a list of the provided size."""
+        height = self._height()
+        self._grow(height, size)
+
+        below = None
+        for lane, tail in enumerate(self.tails):
+            if lane < height:
+                entry = _Skip(node, 1, below)
+                tail.next = entry
+                self.tails[lane] = entry
+                below = entry
+            else:
+                tail.width += 1
+
+    def insert(self, idx: int, node: Node, size: int) -> None:
+        """Adds the node inserted at position idx of a list of the provided size."""
+        height = self._height()
+        self._grow(height, size)
+
+        below = None
+        for lane, (entry, position) in enumerate(self._predecessors(idx)):
+            if lane < height:
+                new = _Skip(node, position + entry.width + 1 - idx, below)
+                new.next = entry.next
+                entry.next = new
+                entry.width = idx - position
+
+                if self.tails[lane] is entry:
+                    self.tails[lane] = new
+
+                below = new
+            else:
+                entry.width += 1
+
+    def delete(self, idx: int) -> None:
+        """Removes the node deleted from position idx."""
+        for lane, (entry, position) in enumerate(self._predecessors(idx)):
+            removed = entry.next
+
+            if removed is not None and position + entry.width == idx:
+                entry.width += removed.width - 1
+                entry.next = removed.next
+
+                if self.tails[lane] is removed:
+                    self.tails[lane] = entry
+            else:
+                entry.width -= 1
+
+        while self.heads and self.heads[-1].next is None:
+            self.heads.pop()
+            self.tails.pop()
+
+    def _predecessors(self, idx: int) -> List[Tuple[_Skip, int]]:
+        # Returns, for each lane from the lowest, the last entry before idx and its position.
+        predecessors = []
+        position, entry = -1, self.heads[-1] if self.heads else None
+
+        while entry is not None:
+            while entry.next is not None and position + entry.width < idx:
+                position += entry.width
+                entry = entry.next
+
+            predecessors.append((entry, position))
+            entry = entry.down
+
+        return predecessors[::-1]
+
+    def _grow(self, height: int, size: int) -> None:
+        while len(self.heads) < height:
+            sentinel = _Skip(None, size + 1, self.heads[-1] if self.heads else None)
+            self.heads.append(sentinel)
+            self.tails.append(sentinel)
+
+    def _height(self) -> int:
+        height = 0
+        while height < SKIP_LIST_MAX_LANES and random.random() < SKIP_LIST_PROBABILITY:
+            height += 1
+
+        return height
 
 
 class LinkedList:
     """Represents a Linked List.
 
+    The list keeps track of its size and tail, so len(), get_last() and appending are O(1).
+        They are kept up to date by the methods of the list and the functions of this module.
+        Linking nodes by hand (e.g., node.next = other) bypasses them, except when setting
+        the head, which walks the new nodes to recompute the size and tail.
+        The same goes for lists that share nodes (e.g., after adding a node of another list):
+        changes made through one list are not seen by the size and tail of the other, so the
+        latter cannot rely on len() or get_last(). Appending checks that the tail is still the
+        last node, and walks to the last one otherwise, so that no node is unlinked.
+        size_and_tail() walks the nodes, and is always accurate.
+
+    Optionally, the list can keep an index from values to nodes, so that get_node and
+        containment checks are O(1) on average. The values must be hashable.
+
+    Optionally, the list can keep a skip list over its nodes, so that at, insert and delete
+        are O(log(N)) on average. Iterating the list is not affected.
+
     Args:
-        items: list of items to insert.
+        items: items to insert. Any iterable, e.g., a generator, a file or a database cursor.
+            It is consumed lazily in one pass.
+        indexed: whether to keep an index from values to nodes. See the indexed property.
+        skip_list: whether to keep a skip list over the nodes. See the skip_list property.
     """
-    def __init__(self, items: List[Any] = None):
-        self.head = None
+    def __init__(
+        self, items: Iterable[Any] = None, indexed: bool = False, skip_list: bool = False
+    ):
+        self._head = None
+        self._tail = None
+        self._size = 0
+        self._nodes_by_value = {} if indexed else None
+        self._skip_list = skip_list
+        self._lanes = None
 
         if items is not None:
-            node = Node(data=items[0])
-            self.head = node
-            self.add_items(items[1:])
+            self.extend(items)
 
     def __repr__(self):
         items = self.tolist()
@@ -43,26 +236,28 @@ class LinkedList:
             yield node
             node = node.next
 
+    def __contains__(self, data):
+        return self.get_node(data) is not None
+
     def __len__(self):
-        size, _ = self.size_and_tail()
+        """Returns the number of nodes.
 
-        return size
+        Complexity:
+            - Time: O(1).
+            - Space: O(1).
+        """
+        return self._size
 
     def __eq__(self, other):
         if not isinstance(other, LinkedList):
             raise ValueError("A LinkedList can only be compared to another LinkedList.")
 
-        one = self.head
-        two = other.head
-
-        while one is not None and two is not None:
-            if not one.data == two.data:
+        end = object()
+        for one, two in itertools.zip_longest(self._values(), other._values(), fillvalue=end):
+            if one is end or two is end or not one == two:
                 return False
 
-            one = one.next
-            two = two.next
-
-        return one is None and two is None
+        return True
 
     def tolist(self):
         """Converts linked list to list."""
@@ -79,23 +274,94 @@ class LinkedList:
         return ''.join(map(str, self.tolist()))
 
     def add_node(self, node: Node):
-        """Inserts a node at the end of the linked-list."""
-        last_node = self.get_last()
-        last_node.next = node
+        """Inserts a node at the end of the linked-list.
+
+        If the node is linked to other nodes, they are appended too. They can loop back
+            to a node of the list (e.g., to create a loop), but can't form a loop of their own.
+
+        Complexity:
+            - Time: O(K).
+            - Space: O(1).
 
-    def add_items(self, items: List[Any]):
-        """Inserts list of items at the end of the linked list."""
-        tail = self.head
+        Where K is the number of appended nodes (1 for a single node), plus the number
+            of nodes appended after the tail through another list that shares it, if any.
+        """
+        self._follow_tail()
+
+        if self._tail is None:
+            self._head = node
+        else:
+            self._tail.next = node
 
-        while tail.next is not None:
+        self._index_node(node)
+
+        size, tail = 1, node
+        while tail.next is not None and tail.next is not node:
             tail = tail.next
+            self._index_node(tail)
+            size += 1
+
+        self._size += size
+        self._tail = tail
+        self._appended(node, self._size - size)
+
+    def add_items(self, items: Iterable[Any]):
+        """Inserts items at the end of the linked list. Same as extend."""
+        self.extend(items)
+
+    def extend(self, items: Iterable[Any]):
+        """Inserts items at the end of the linked list, starting from the tail.
+
+        The items can be any iterable, e.g., a generator, a file or a database cursor.
+            It is consumed lazily in one pass, without intermediate copies.
+
+        Complexity:
+            - Time: O(K).
+            - Space: O(K).
+
+        Where K is the number of items (see add_node). The space is for the new nodes only.
+        """
+        self._follow_tail()
+
+        items = iter(items)
+        tail = previous_tail = self._tail
+        size = previous_size = self._size
+        index = self._nodes_by_value
+
+        if tail is None:
+            for item in items:
+                tail = self._head = Node(item)
+                size += 1
+                if index is not None:
+                    index[item] = {tail: None}
+                break
 
         for item in items:
-            tail.next = Node(data=item)
-            tail = tail.next
+            node = Node(item)
+            tail.next = node
+            tail = node
+            size += 1
+            if index is not None:
+                index.setdefault(item, {})[node] = None
+
+        self._tail = tail
+        self._size = size
+
+        if size > previous_size:
+            self._appended(
+                self._head if previous_tail is None else previous_tail.next, previous_size)
 
     def get_node(self, data):
-        """Returns the node with provided data. If more than one, first is returned."""
+        """Returns the node with provided data. If more than one, first is returned.
+
+        Complexity:
+            - Time: O(N), or O(1) on average if the list is indexed.
+            - Space: O(1).
+        """
+        if self._nodes_by_value is not None:
+            nodes = self._nodes_by_value.get(data)
+            return next(iter(nodes)) if nodes else None
+
         node = None
         for n in self:
             if n.data == data:
@@ -105,23 +371,99 @@ class LinkedList:
         return node
 
     def get_last(self):
-        """Returns last node."""
-        node = None
-        for n in self:
-            node = n
+        """Returns last node.
 
-        return node
+        Complexity:
+            - Time: O(1).
+            - Space: O(1).
+        """
+        return self._tail
 
     def at(self, idx):
-        """Returns node at index idx."""
-        i = 0
-        for node in self:
-            if i == idx:
-                return node
+        """Returns node at index idx.
 
-            i += 1
+        Complexity:
+            - Time: O(N), or O(log(N)) on average with a skip list.
+            - Space: O(1).
+        """
+        self._check_bounds(idx, self._size - 1)
+
+        if self._skip_list:
+            return self._get_lanes().locate(idx, self._head)
+
+        node = self._head
+        for _ in range(idx):
+            node = node.next
+
+        return node
+
+    def insert(self, idx: int, data: Any) -> Node:
+        """Inserts an item at index idx, and returns its node.
+
+        If the list is indexed and the item was already in it, the index of the item is rebuilt
+            to keep its nodes in order, which takes O(N) time.
+
+        Complexity:
+            - Time: O(N), or O(log(N)) on average with a skip list.
+            - Space: O(1).
+        """
+        self._check_bounds(idx, self._size)
+
+        node = self._new_node(data)
+
+        if idx == self._size:
+            self.add_node(node)
+            return node
+
+        if idx == 0:
+            node.next = self._head
+            self._head = node
+        else:
+            previous = self.at(idx - 1)
+            node.next = previous.next
+            previous.next = node
+
+        if self._lanes is not None:
+            self._lanes.insert(idx, node, self._size)
+
+        self._size += 1
+
+        if self.indexed and data in self._nodes_by_value:
+            self._nodes_by_value[data] = {n: None for n in self if n.data == data}
+        else:
+            self._index_node(node)
+
+        return node
+
+    def delete(self, idx: int) -> Any:
+        """Deletes the node at index idx, and returns its data.
+
+        Complexity:
+            - Time: O(N), or O(log(N)) on average with a skip list.
+            - Space: O(1).
+        """
+        self._check_bounds(idx, self._size - 1)
+
+        previous = self.at(idx - 1) if idx > 0 else None
+        node = self._head if previous is None else previous.next
 
-        raise ValueError("index {} out of bounds for list: {}!".format(idx, self.tolist()))
+        if previous is None:
+            self._head = node.next
+        else:
+            previous.next = node.next
+
+        if node is self._tail:
+            self._tail = previous
+
+        if self._lanes is not None:
+            self._lanes.delete(idx)
+
+        self._size -= 1
+
+        data = node.data
+        self._discard(node)
+
+        return data
 
     def reverse(self):
         """Reverses the linked list in-place.
@@ -130,53 +472,748 @@ class LinkedList:
             - Time: O(N).
             - Space: O(1)
         """
-        _prev = None
-        _current = self.head
+        self._head, self._tail = _reverse_nodes(self._head), self._head
+        self._reverse_index()
+        self._invalidate_lanes()
+
+    def _values(self) -> Generator[Any, None, None]:
+        node = self.head
+
+        while node is not None:
+            yield node.data
+            node = node.next
+
+    def size_and_tail(self):
+        """Returns the size and tail of linked-list, walking its nodes.
+
+        Unlike len() and get_last(), it does not rely on the size and tail kept by the list,
+            so it is accurate for lists that share nodes with other lists.
+
+        Complexity:
+            - Time: O(N).
+            - Space: O(1).
+        """
+        return _size_and_tail(self.head)
+
+    @property
+    def indexed(self) -> bool:
+        """Whether the list keeps an index from values to nodes.
+
+        Setting it to True builds the index in O(N) time and space. Setting it to False drops it.
+            While enabled, it is kept up to date by the methods of the list and the functions
+            of this module, like the size and tail.
+        """
+        return self._nodes_by_value is not None
+
+    @indexed.setter
+    def indexed(self, indexed: bool):
+        self._nodes_by_value = {} if indexed else None
+        self._build_index()
+
+    def _build_index(self) -> None:
+        if self._nodes_by_value is None:
+            return
+
+        self._nodes_by_value = {}
+        for node in self:
+            self._index_node(node)
+
+    def _follow_tail(self) -> None:
+        # Nodes can be appended after the tail through another list that shares it.
+        # Takes them into account, so that appending doesn't unlink them. If the nodes
+        # after the tail loop back (e.g., to a node of this list), the tail is kept.
+        tail = self._tail
+        if tail is None or tail.next is None:
+            return
+
+        seen = {tail}
+        node = tail.next
+        while node.next is not None:
+            if node in seen:
+                return
+
+            seen.add(node)
+            node = node.next
+
+        first, position = tail.next, self._size
+
+        self._size += len(seen)
+        self._tail = node
+
+        node = first
+        while node is not None:
+            self._index_node(node)
+            node = node.next
+
+        self._appended(first, position)
+
+    def _index_node(self, node: Node) -> None:
+        if self._nodes_by_value is not None:
+            self._nodes_by_value.setdefault(node.data, {})[node] = None
+
+    def _unindex_node(self, node: Node, replacement: Node = None) -> None:
+        # If a replacement is provided, it takes the place of the node among the nodes
+        # with the same data, which are kept in the order of the list.
+        if self._nodes_by_value is None:
+            return
+
+        nodes = self._nodes_by_value[node.data]
+
+        if replacement is not None:
+            self._nodes_by_value[node.data] = {
+                replacement if n is node else n: None for n in nodes}
+            return
+
+        del nodes[node]
+
+        if not nodes:
+            del self._nodes_by_value[node.data]
+
+    def _reverse_index(self) -> None:
+        if self._nodes_by_value is None:
+            return
+
+        for data, nodes in self._nodes_by_value.items():
+            self._nodes_by_value[data] = dict.fromkeys(reversed(nodes))
+
+    def _discard(self, node: Node, replacement: Node = None) -> None:
+        # Called by the functions of this module when they unlink a node from the list.
+        self._unindex_node(node, replacement)
+
+    @property
+    def skip_list(self) -> bool:
+        """Whether the list keeps a skip list over its nodes, for positional access.
+
+        The skip list takes O(N) space, about a third of an entry per node. Appending,
+            inserting and deleting by position keep it up to date. Other changes
+            (e.g., reverse or the functions of this module) discard it,
+            and it is rebuilt in O(N) time on the next positional access.
+        """
+        return self._skip_list
+
+    @skip_list.setter
+    def skip_list(self, skip_list: bool):
+        self._skip_list = skip_list
+        self._lanes = None
+
+    def _get_lanes(self) -> _SkipList:
+        if self._lanes is None:
+            self._lanes = _SkipList.build(self._head)
+
+        return self._lanes
+
+    def _invalidate_lanes(self) -> None:
+        self._lanes = None
+
+    def _appended(self, node: Node, position: int) -> None:
+        # Adds the nodes from node (at position) to the end of the list to the skip list.
+        if self._lanes is None:
+            return
+
+        while node is not None and position < self._size:
+            self._lanes.append(node, position)
+            node = node.next
+            position += 1
+
+    def _new_node(self, data: Any) -> Node:
+        return Node(data)
+
+    def _check_bounds(self, idx: int, last: int) -> None:
+        if not 0 <= idx <= last:
+            raise ValueError("index {} out of bounds for list of size {}!".format(idx, self._size))
+
+    @property
+    def head(self):
+        """The first node of the linked list."""
+        return self._head
+
+    @head.setter
+    def head(self, node: Node):
+        """Sets the first node, and walks the linked nodes to recompute the size and tail.
+
+        Complexity:
+            - Time: O(N).
+            - Space: O(1).
+        """
+        self._head = node
+        self._size, self._tail = _size_and_tail(node)
+        self._build_index()
+        self._invalidate_lanes()
+
+
+def _reverse_nodes(head: Node) -> Node:
+    # Reverses the nodes linked from head, in-place, and returns the new head.
+    _prev = None
+    _current = head
+
+    while _current is not None:
+        _next = _current.next
+        _current.next = _prev
+        _prev = _current
+        _current = _next
+
+    return _prev
+
+
+def _size_and_tail(head: Node) -> Tuple[int, Node]:
+    i = 0
+    tail = None
+
+    node = head
+    while node is not None:
+        tail = node
+        node = node.next
+        i += 1
+
+    return i, tail
+
+
+class CompactNode:
+    """A node of a CompactLinkedList.
+
+    It's a view of one position of the arrays of the list. There is at most one CompactNode
+        for each position at any time, so nodes can be compared with "is".
+
+    Args:
+        llist: the list the node belongs to.
+        index: the position of the node in the arrays of the list.
+    """
+    __slots__ = ('_llist', '_index', '__weakref__')
+
+    def __init__(self, llist: 'CompactLinkedList', index: int):
+        self._llist = llist
+        self._index = index
+
+    def __repr__(self):
+        return str(self.data)
+
+    @property
+    def data(self) -> Any:
+        return self._llist._data[self._index]
+
+    @data.setter
+    def data(self, data: Any):
+        self._llist._data[self._index] = data
+
+    @property
+    def next(self) -> 'CompactNode':
+        index = self._llist._next[self._index]
+
+        if index == NULL_INDEX:
+            return None
+
+        return self._llist._node(index)
+
+    @next.setter
+    def next(self, node: 'CompactNode'):
+        if node is None:
+            self._llist._next[self._index] = NULL_INDEX
+            return
+
+        if not self._llist._owns(node):
+            raise ValueError("A CompactNode can only link to nodes of the same list.")
+
+        self._llist._next[self._index] = node._index
+
+
+class CompactLinkedList(LinkedList):
+    """A Linked List that stores its data and next pointers in two parallel arrays.
+
+    Nodes don't exist as Python objects, except while they are referenced from outside (see
+        CompactNode). This takes 16 bytes per item (plus the items themselves, if they are
+        objects), instead of the 48 bytes of a Node, and building the list is faster.
+
+    Other than that, it trades speed for memory (see benchmarks/bench_llists.py). The methods
+        that walk the arrays (e.g., tolist, at, reverse) take up to five times as long as with
+        a LinkedList, since each read from an array creates an int. Walking the nodes (iterating
+        the list, following node.next, and the functions of this module) creates a CompactNode
+        for each position, and is fifty to three hundred times slower.
+
+    Positions freed by the functions of this module (e.g., remove_duplicates) are kept in
+        a free list, and reused by add_node.
+
+    It has the same API as LinkedList, and can be used with the functions of this module.
+        Nodes can't be shared between lists: add_node copies the data of nodes from elsewhere.
+
+    Args:
+        items: items to insert. Any iterable.
+        typecode: if provided, the data is stored in an array of this type
+            (e.g., 'q' for 64-bit integers) instead of a list of objects.
+        indexed: whether to keep an index from values to nodes. Note that the index
+            keeps a CompactNode alive for every item.
+        skip_list: whether to keep a skip list over the nodes.
+    """
+    def __init__(
+        self,
+        items: Iterable[Any] = None,
+        typecode: str = None,
+        indexed: bool = False,
+        skip_list: bool = False,
+    ):
+        self._typecode = typecode
+        self._data = array(typecode) if typecode else []
+        self._next = array('q')
+        self._free = array('q')
+        self._nodes = WeakValueDictionary()
+
+        super().__init__(items, indexed=indexed, skip_list=skip_list)
+
+    def __deepcopy__(self, memo):
+        return CompactLinkedList(
+            copy.deepcopy(self.tolist(), memo), self._typecode,
+            indexed=self.indexed, skip_list=self.skip_list)
+
+    def __iter__(self):
+        for index in self._indices():
+            yield self._node(index)
 
-        while _current is not None:
-            _next = _current.next
-            _current.next = _prev
-            _prev = _current
-            _current = _next
+    def _values(self) -> Generator[Any, None, None]:
+        _data, _next = self._data, self._next
+        i = self._index(self._head)
 
-        self.head = _prev
+        while i != NULL_INDEX:
+            yield _data[i]
+            i = _next[i]
 
     def size_and_tail(self):
-        """Returns the size and tail of linked-list."""
+        """Returns the size and tail of linked-list, walking its arrays.
+
+        Complexity:
+            - Time: O(N).
+            - Space: O(1).
+        """
         i = 0
-        node = None
+        tail = NULL_INDEX
 
-        for n in self:
-            node = n
+        for tail in self._indices():
             i += 1
 
-        return i, node
+        return i, self._node(tail)
 
+    def tolist(self):
+        """Converts linked list to list."""
+        data, _next = self._data, self._next
+        items = []
 
-def remove_duplicates(llist: LinkedList) -> None:
-    """Removes duplicates (in-place) from a linked list.
+        i = self._index(self._head)
+        while i != NULL_INDEX:
+            items.append(data[i])
+            i = _next[i]
 
-    Complexity:
-    - Time: O(N)
-    - Space: O(N)
+        return items
+
+    def add_node(self, node: Node):
+        """Inserts a node at the end of the linked-list.
+
+        If the node belongs to another list, its data (and the data of the nodes linked to it)
+            is copied. If the nodes linked to it loop, each of them is copied once.
+
+        Complexity:
+            - Time: O(K).
+            - Space: O(1), or O(K) if the node belongs to another list.
+
+        Where K is the number of appended nodes (1 for a single node).
+        """
+        if self._owns(node):
+            super().add_node(node)
+            return
+
+        copied = set()
+        chain = node
+        while chain is not None and chain not in copied:
+            self._link(self._allocate(chain.data))
+            self._index_node(self._tail)
+            self._appended(self._tail, self._size - 1)
+
+            copied.add(chain)
+            chain = chain.next
+
+    def extend(self, items: Iterable[Any]):
+        """Inserts items at the end of the linked list.
+
+        Complexity:
+            - Time: O(K).
+            - Space: O(K).
+
+        Where K is the number of items.
+        """
+        start = len(self._next)
+        start_size = self._size
+
+        self._data.extend(items)
+        end = len(self._data)
+
+        if end == start:
+            return
+
+        self._next.extend(range(start + 1, end))
+        self._next.append(NULL_INDEX)
+
+        self._link(start)
+        self._size += end - start - 1
+        self._tail = self._node(end - 1)
+
+        if self.indexed:
+            for i in range(start, end):
+                self._index_node(self._node(i))
+
+        self._appended(self._node(start), start_size)
+
+    def get_node(self, data):
+        """Returns the node with provided data. If more than one, first is returned.
+
+        Complexity:
+            - Time: O(N), or O(1) on average if the list is indexed.
+            - Space: O(1).
+        """
+        if self.indexed:
+            return super().get_node(data)
+
+        _data = self._data
+        for i in self._indices():
+            if _data[i] == data:
+                return self._node(i)
+
+        return None
+
+    def at(self, idx):
+        """Returns node at index idx.
+
+        Complexity:
+            - Time: O(N), or O(log(N)) on average with a skip list.
+            - Space: O(1).
+        """
+        if self.skip_list:
+            return super().at(idx)
+
+        self._check_bounds(idx, self._size - 1)
+
+        _next = self._next
+        i = self._index(self._head)
+        for _ in range(idx):
+            i = _next[i]
+
+        return self._node(i)
+
+    def reverse(self):
+        """Reverses the linked list in-place.
+
+        Complexity:
+            - Time: O(N).
+            - Space: O(1)
+        """
+        _next = self._next
+        _prev = NULL_INDEX
+        i = self._index(self._head)
+
+        while i != NULL_INDEX:
+            following = _next[i]
+            _next[i] = _prev
+            _prev = i
+            i = following
+
+        self._head, self._tail = self._tail, self._head
+        self._reverse_index()
+        self._invalidate_lanes()
+
+    @property
+    def head(self):
+        """The first node of the linked list."""
+        return self._head
+
+    @head.setter
+    def head(self, node: CompactNode):
+        if node is not None and not self._owns(node):
+            raise ValueError("The head of a CompactLinkedList must be one of its nodes.")
+
+        LinkedList.head.fset(self, node)
+
+    def _discard(self, node: CompactNode, replacement: CompactNode = None) -> None:
+        super()._discard(node, replacement)
+        self._free.append(node._index)
+        self._nodes.pop(node._index, None)
+
+    def _new_node(self, data: Any) -> CompactNode:
+        return self._node(self._allocate(data))
+
+    def _allocate(self, data: Any) -> int:
+        if self._free:
+            i = self._free.pop()
+            self._data[i] = data
+            self._next[i] = NULL_INDEX
+            return i
+
+        self._data.append(data)
+        self._next.append(NULL_INDEX)
+
+        return len(self._next) - 1
+
+    def _link(self, index: int) -> None:
+        # Appends the node at index, which is not linked to any other.
+        if self._tail is None:
+            self._head = self._node(index)
+        else:
+            self._next[self._tail._index] = index
+
+        self._tail = self._node(index)
+        self._size += 1
+
+    def _indices(self):
+        _next = self._next
+        i = self._index(self._head)
+
+        while i != NULL_INDEX:
+            yield i
+            i = _next[i]
+
+    def _index(self, node: CompactNode) -> int:
+        return NULL_INDEX if node is None else node._index
+
+    def _node(self, index: int) -> CompactNode:
+        if index == NULL_INDEX:
+            return None
+
+        node = self._nodes.get(index)
+
+        if node is None:
+            node = CompactNode(self, index)
+            self._nodes[index] = node
+
+        return node
+
+    def _owns(self, node) -> bool:
+        return isinstance(node, CompactNode) and node._llist is self
+
+
+def remove_duplicates(
+    llist: LinkedList,
+    method: str = 'set',
+    error_rate: float = BLOOM_ERROR_RATE,
+    chunk_size: int = EXTERNAL_CHUNK_SIZE,
+) -> int:
+    """Removes duplicates (in-place) from a linked list. The first occurrences are kept.
+
+    Methods:
+    - set: keeps the seen values in a set. If the list is indexed, its index is used instead,
+        which takes O(N) space, but is kept by the list anyway.
+        - Time: O(N).
+        - Space: O(D).
+    - runner: for each node, a second runner removes the following nodes with the same value.
+        - Time: O(N^2).
+        - Space: O(1).
+    - bloom: a first pass adds the values to a Bloom filter, and keeps in a set the ones that
+        may have been seen before. A second pass removes duplicates among those only.
+        Good for lists with many distinct values and few duplicates.
+        - Time: O(N).
+        - Space: O(N * log(1 / E) + R).
+    - external: sorts (value, position) pairs in chunks saved to temporary files,
+        and merges them to find the positions of the duplicates, which are sorted the same way.
+        The memory is bounded by the chunk size, whatever the number of distinct values.
+        The values must be comparable and picklable.
+        - Time: O(N * log(N)).
+        - Space: O(C).
+
+    Where D is the number of distinct values, E the error rate of the Bloom filter,
+        R the number of values repeated or reported by the filter, and C the chunk size.
+        The values themselves are shared with the list, and not counted.
+
+    Args:
+        llist: the linked list.
+        method: the algorithm to use. One of DUPLICATES_METHODS.
+        error_rate: the false positive rate of the Bloom filter, for the bloom method.
+        chunk_size: the number of values sorted in memory, for the external method.
 
-    Notes:
-        If memory is important, an alternative with O(1) space can be implemented.
-        In that case we can iterate the linked list with two runners (TODO).
-        The time complexity in that case is O(N^2).
+    Returns:
+        the memory used by the auxiliary data structures, in bytes (as of sys.getsizeof).
+            For an indexed list with the set method, the size of its index before removing
+            the duplicates. For the runner method, 0, since it uses none.
     """
-    data = set()
+    if method not in DUPLICATES_METHODS:
+        raise ValueError("Method {} not valid. Choose from {}".format(method, DUPLICATES_METHODS))
+
+    if method == 'runner':
+        _remove_duplicates_runner(llist)
+        return 0
+
+    if method == 'bloom':
+        return _remove_duplicates_bloom(llist, error_rate)
+
+    if method == 'external':
+        return _remove_duplicates_external(llist, chunk_size)
+
+    if llist.indexed:
+        index = llist._nodes_by_value
+        memory = sys.getsizeof(index) + builtins.sum(map(sys.getsizeof, index.values()))
+
+        _remove_nodes(llist, lambda node: llist.get_node(node.data) is not node)
+        return memory
 
+    seen = set()
+    _remove_nodes(llist, lambda node: _seen_before(node.data, seen))
+
+    return sys.getsizeof(seen)
+
+
+def _remove_nodes(llist: LinkedList, is_duplicate) -> None:
+    # Unlinks the nodes for which is_duplicate returns True, called once per node, in order.
     prev = llist.head
     for node in llist:
-        if node.data in data:
+        if is_duplicate(node):
             prev.next = node.next
-            prev = node
+            llist._size -= 1
+            llist._discard(node)
             continue
 
-        data.add(node.data)
         prev = node
 
+    llist._tail = prev
+    llist._invalidate_lanes()
+
+
+def _seen_before(value: Any, seen: set) -> bool:
+    if value in seen:
+        return True
+
+    seen.add(value)
+    return False
+
+
+def _remove_duplicates_runner(llist: LinkedList) -> None:
+    current = llist.head
+
+    while current is not None:
+        runner = current
+        while runner.next is not None:
+            if runner.next.data == current.data:
+                removed = runner.next
+                runner.next = removed.next
+                llist._size -= 1
+                llist._discard(removed)
+            else:
+                runner = runner.next
+
+        llist._tail = current
+        current = current.next
+
+    llist._invalidate_lanes()
+
+
+def _remove_duplicates_bloom(llist: LinkedList, error_rate: float) -> int:
+    bloom = _BloomFilter(len(llist), error_rate)
+    suspects = set()
+
+    for value in llist._values():
+        if bloom.add(value):
+            suspects.add(value)
+
+    seen = set()
+    _remove_nodes(llist, lambda node: node.data in suspects and _seen_before(node.data, seen))
+
+    return bloom.nbytes + sys.getsizeof(suspects) + sys.getsizeof(seen)
+
+
+def _remove_duplicates_external(llist: LinkedList, chunk_size: int) -> int:
+    memory = 0
+
+    def sorted_runs(items):
+        nonlocal memory
+
+        for chunk in _chunks(items, chunk_size):
+            chunk.sort()
+            memory = max(memory, sys.getsizeof(chunk) + builtins.sum(map(sys.getsizeof, chunk)))
+
+            run = tempfile.TemporaryFile()
+            for item in chunk:
+                pickle.dump(item, run)
+
+            run.seek(0)
+            yield run
+
+    def duplicate_positions():
+        pairs = ((value, i) for i, value in enumerate(llist._values()))
+        runs = list(sorted_runs(pairs))
+        try:
+            merged = heapq.merge(*map(_read_run, runs))
+            for _, group in itertools.groupby(merged, key=lambda pair: pair[0]):
+                next(group)
+                yield from (position for _, position in group)
+        finally:
+            for run in runs:
+                run.close()
+
+    runs = list(sorted_runs(duplicate_positions()))
+    try:
+        positions = heapq.merge(*map(_read_run, runs))
+        duplicate = next(positions, None)
+        counter = itertools.count()
+
+        def is_duplicate(node):
+            nonlocal duplicate
+            if next(counter) != duplicate:
+                return False
+
+            duplicate = next(positions, None)
+            return True
+
+        _remove_nodes(llist, is_duplicate)
+    finally:
+        for run in runs:
+            run.close()
+
+    return memory
+
+
+def _chunks(items: Iterable, chunk_size: int) -> Generator[List, None, None]:
+    iterator = iter(items)
+
+    chunk = list(itertools.islice(iterator, chunk_size))
+    while chunk:
+        yield chunk
+        chunk = list(itertools.islice(iterator, chunk_size))
+
+
+def _read_run(run) -> Generator[Any, None, None]:
+    while True:
+        try:
+            yield pickle.load(run)
+        except EOFError:
+            return
+
+
+class _BloomFilter:
+    """A set of hashable values, that can have false positives but no false negatives.
+
+    Args:
+        capacity: the expected number of values.
+        error_rate: the false positive rate when the filter holds capacity values.
+    """
+    def __init__(self, capacity: int, error_rate: float):
+        capacity = max(capacity, 1)
+
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    @property
+    def nbytes(self) -> int:
+        return sys.getsizeof(self.bits)
+
+    def add(self, value: Any) -> bool:
+        """Adds a value, and returns whether it may have been added before."""
+        h1 = hash(value)
+        h2 = hash((value, self.size)) | 1
+
+        present = True
+        for i in range(self.hashes):
+            bit = (h1 + i * h2) % self.size
+            byte, mask = bit >> 3, 1 << (bit & 7)
+
+            if not self.bits[byte] & mask:
+                self.bits[byte] |= mask
+                present = False
+
+        return present
+
 
 def kth_to_last(llist: LinkedList, k: int, size: int = None) -> Node:
     """Returns the kth element, counting from the last.
@@ -238,18 +1275,33 @@ def kth_to_last_recursive(head: Node, k: int) -> Tuple[Node, int]:
     return node, i
 
 
-def delete_middle_node(node: Node) -> None:
+def delete_middle_node(node: Node, llist: LinkedList) -> None:
     """Deletes a middle node from a linked-list.
 
     Complexity:
         - Time: O(1).
         - Space: (1).
+
+    Args:
+        node: the node to delete.
+        llist: the linked list the node belongs to, to keep its size, tail, index
+            and skip list up to date.
     """
     if node.next is None:
         raise ValueError("node is not a middle one!")
 
-    node.data = node.next.data
-    node.next = node.next.next
+    removed = node.next
+
+    llist._size -= 1
+    if removed is llist._tail:
+        llist._tail = node
+
+    llist._unindex_node(node)
+    llist._discard(removed, replacement=node)
+    llist._invalidate_lanes()
+
+    node.data = removed.data
+    node.next = removed.next
 
 
 def partition(llist: LinkedList, x: int) -> LinkedList:
@@ -261,6 +1313,9 @@ def partition(llist: LinkedList, x: int) -> LinkedList:
     """
 
     head = llist.head
+    if head is None:
+        return llist
+
     node = head.next
 
     _prev = head
@@ -276,53 +1331,149 @@ def partition(llist: LinkedList, x: int) -> LinkedList:
 
         node = _next
 
-    llist.head = head
+    llist._head = head
+    llist._tail = _prev
+    llist._build_index()
+    llist._invalidate_lanes()
 
     return llist
 
 
-def sum(l1: LinkedList, l2: LinkedList) -> LinkedList:
-    """Sum of two numbers represented by linked lists.
+def sum(l1: LinkedList, l2: LinkedList, reverse: bool = True, base: int = 10) -> LinkedList:
+    """Sum of two numbers represented by linked lists, one digit per node.
+
+    The lists are walked once, adding digit by digit with a carry.
+        Each node can hold a bigger "digit" by using a bigger base, e.g., LIMB_BASE (10^9)
+        stores nine decimal digits per node, so there are nine times less nodes to walk.
 
-    The algorithm assumes the numbers are represented in reversed order.
+    If the digits are in forward order, the most significant first, a carry changes digits
+        that were already added. So the last digit lower than base - 1 is held back, with the
+        count of (base - 1) digits after it, until it's known whether a carry reaches them.
 
     Complexity:
         Time: O(N).
         Space: O(N).
 
     Where N is max(A, B), and A, B the lengths of l1 and l2, respectively.
+        The space is for the result only.
+
+    Args:
+        l1: the first number.
+        l2: the second number.
+        reverse: whether the digits are in reversed order, the least significant first.
+        base: the base of the digits. Every digit must be lower than it.
 
     Returns:
-        the sum represented as a linked-list.
+        the sum represented as a linked-list, in the same order and base.
+            Empty lists represent zero, and the sum of two empty lists is empty.
     """
-    l1_numbers = l1.tolist()[::-1]
-    l2_numbers = l2.tolist()[::-1]
+    if reverse:
+        return LinkedList(_add_reversed(l1, l2, base))
+
+    return LinkedList(_add_forward(l1, l2, base))
+
+
+def _add_reversed(l1: LinkedList, l2: LinkedList, base: int) -> Generator[int, None, None]:
+    carry = 0
+    digits = itertools.zip_longest(l1._values(), l2._values(), fillvalue=0)
+
+    for d1, d2 in digits:
+        carry, digit = divmod(d1 + d2 + carry, base)
+        yield digit
 
-    l1_int = int(''.join(map(str, l1_numbers)))
-    l2_int = int(''.join(map(str, l2_numbers)))
+    if carry:
+        yield carry
+
+
+def _add_forward(l1: LinkedList, l2: LinkedList, base: int) -> Generator[int, None, None]:
+    longer, shorter = (l1, l2) if len(l1) >= len(l2) else (l2, l1)
+
+    digits = longer._values()
+    totals = itertools.chain(
+        itertools.islice(digits, len(longer) - len(shorter)),
+        (d1 + d2 for d1, d2 in zip(digits, shorter._values())))
+
+    pending = 0  # The last digit lower than base - 1. Starts as a leading zero.
+    maxed = 0  # The number of (base - 1) digits after it.
+    leading = True
+
+    for total in totals:
+        if total == base - 1:
+            maxed += 1
+            continue
 
-    l3_int = l1_int + l2_int
+        carry, digit = divmod(total, base)
 
-    l3_numbers = [int(x) for x in str(l3_int)]
+        if not (leading and pending + carry == 0):
+            yield pending + carry
 
-    return LinkedList(l3_numbers[::-1])
+        yield from itertools.repeat(0 if carry else base - 1, maxed)
 
+        pending, maxed, leading = digit, 0, False
 
-def is_palindrome(llist: LinkedList, method: str = 'reverse') -> bool:
+    if not (leading and pending == 0):
+        yield pending
+
+    yield from itertools.repeat(base - 1, maxed)
+
+
+def is_palindrome(llist: LinkedList, method: str = 'halves') -> bool:
     """Checks if the items in a linked-list form a palindrome.
 
-    Complexity:
+    Methods:
+    - halves: finds the middle with two runners, reverses the second half in-place,
+        compares it with the first half and reverses it back. The list is left unchanged.
+        - Time: O(N).
+        - Space: O(1).
+    - reverse: compares the list with a reversed copy of it.
         - Time: O(N).
         - Space: O(N).
+    - iterative: pushes the first half into a stack, and pops it while walking the second half.
+        - Time: O(N).
+        - Space: O(N).
+    - recursive: compares the nodes from the middle outwards, while the recursion unwinds.
+        Raises RecursionError for lists longer than about twice the recursion limit.
+        - Time: O(N).
+        - Space: O(N).
+
+    Args:
+        llist: the linked list to check.
+        method: the algorithm to use. One of PALINDROME_METHODS.
     """
-    METHODS = ['iterative', 'reverse', 'recursive']
+    if method not in PALINDROME_METHODS:
+        raise ValueError("Method {} not valid. Choose from {}".format(method, PALINDROME_METHODS))
 
-    if method not in METHODS:
-        raise ValueError("Method {} not valid. Choose from {}".format(method, METHODS))
+    if method == 'halves':
+        if llist.head is None:
+            return True
 
-    if method == 'reverse':
+        slow = llist.head
+        fast = llist.head
+
+        while fast.next is not None and fast.next.next is not None:
+            slow = slow.next
+            fast = fast.next.next
+
+        # slow is the last node of the first half (the middle one, if the length is odd).
+        second_half = _reverse_nodes(slow.next)
+        try:
+            p1 = llist.head
+            p2 = second_half
+
+            while p2 is not None:
+                if not p1.data == p2.data:
+                    return False
+
+                p1 = p1.next
+                p2 = p2.next
+
+            return True
+        finally:
+            slow.next = _reverse_nodes(second_half)
+
+    elif method == 'reverse':
         llist_copy = copy.deepcopy(llist)
-        llist.reverse()
+        llist_copy.reverse()
 
         return llist_copy == llist
 
@@ -379,16 +1530,15 @@ def intersection(l1: LinkedList, l2: LinkedList):
     if l1_tail is not l2_tail:
         return False, None
 
-    len_diff = abs(l1_len - l2_len)
-
     p1 = l1.head
     p2 = l2.head
 
-    if l1_len > l2_len:
-        p1 = l1.at(len_diff)
+    # Walks instead of using at(), which relies on the size kept by the lists.
+    for _ in range(l1_len - l2_len):
+        p1 = p1.next
 
-    if l2_len > l1_len:
-        p2 = l2.at(len_diff)
+    for _ in range(l2_len - l1_len):
+        p2 = p2.next
 
     while p1 is not None:
         if p1 is p2:
@@ -400,6 +1550,76 @@ def intersection(l1: LinkedList, l2: LinkedList):
     return True, p1
 
 
+@dataclass
+class MergeGroup:
+    """Linked lists that share their tail node, and therefore a suffix.
+
+    Attributes:
+        tail: the shared last node.
+        lists: the positions of the lists in the group, in the order they were given.
+        merge_points: for each list after the first one, the node where it joins the lists
+            before it, i.e., its first node that is also in any of them.
+    """
+    tail: Node
+    lists: List[int] = field(default_factory=list)
+    merge_points: Dict[int, Node] = field(default_factory=dict)
+
+
+def merge_points(lists: Iterable[LinkedList]) -> List[MergeGroup]:
+    """Finds the lists that share nodes, among many linked lists, and where they merge.
+
+    Each list is walked until its first node seen in a previous list, which is its merge point.
+        The rest of it was already walked, so the list belongs to the group of that one.
+        For two lists, the merge point is the same node returned by intersection.
+
+    Complexity:
+        - Time: O(N).
+        - Space: O(N).
+
+    Where N is the total number of distinct nodes.
+
+    Args:
+        lists: the linked lists.
+
+    Returns:
+        the groups of lists that share a tail, in order of their first list.
+            Lists that don't share nodes with any other are groups of one. Empty lists are
+            not in any group.
+
+    Raises:
+        ValueError: if a list has a loop, since then it has no tail.
+    """
+    groups = []
+    group_of = {}  # list -> its group.
+    owners = {}  # node -> the first list that walked it.
+
+    for i, llist in enumerate(lists):
+        node = llist.head
+        last = None
+
+        while node is not None and node not in owners:
+            owners[node] = i
+            last = node
+            node = node.next
+
+        if node is not None:
+            if owners[node] == i:
+                raise ValueError("list {} has a loop.".format(i))
+
+            group = group_of[owners[node]]
+            group.lists.append(i)
+            group.merge_points[i] = node
+        elif last is not None:
+            group = MergeGroup(tail=last, lists=[i])
+            groups.append(group)
+        else:
+            continue
+
+        group_of[i] = group
+
+    return groups
+
+
 def loop_detection(llist: LinkedList):
     """Detects a loop in the linked-list and returns the beginning of the loop.
 
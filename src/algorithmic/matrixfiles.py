@@ -0,0 +1,241 @@
+"""Out-of-core algorithms for matrices stored in memory-mapped files.
+
+The file format is a fixed size header followed by the raw values of the matrix in row-major order.
+The header contains a magic number, the typecode of the values (see the array module)
+    and the number of rows and columns of the matrix.
+"""
+import mmap
+import os
+import struct
+from array import array
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Tuple
+
+MAGIC = b'AMTX'
+HEADER_FORMAT = '<4sc3xQQ'
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+DEFAULT_TYPECODE = 'q'
+DEFAULT_BLOCK_SIZE = 256
+
+
+class MatrixFileError(Exception):
+    pass
+
+
+def write_matrix(path: str, matrix: List[List], typecode: str = DEFAULT_TYPECODE) -> None:
+    """Writes a matrix to a file.
+
+    Args:
+        path: the path of the file.
+        matrix: the matrix to write.
+        typecode: the type of the values, as understood by the array module.
+    """
+    rows = len(matrix)
+    columns = len(matrix[0]) if matrix else 0
+
+    with open(path, 'wb') as f:
+        f.write(_pack_header(typecode, rows, columns))
+        for row in matrix:
+            array(typecode, row).tofile(f)
+
+
+def read_matrix(path: str) -> List[List]:
+    """Reads a matrix from a file.
+
+    Args:
+        path: the path of the file.
+    """
+    with open(path, 'rb') as f:
+        typecode, rows, columns = _unpack_header(f.read(HEADER_SIZE))
+
+        matrix = []
+        for _ in range(rows):
+            row = array(typecode)
+            row.fromfile(f, columns)
+            matrix.append(row.tolist())
+
+    return matrix
+
+
+def read_shape(path: str) -> Tuple[str, int, int]:
+    """Returns the typecode, number of rows and number of columns of a matrix file."""
+    with open(path, 'rb') as f:
+        return _unpack_header(f.read(HEADER_SIZE))
+
+
+def rotate_matrix_file(
+    src: str, dst: str, k: int = 1, block_size: int = DEFAULT_BLOCK_SIZE
+) -> None:
+    """Writes to dst the matrix in src rotated k times 90 degrees clock-wise.
+
+    A negative k rotates the matrix counter clock-wise.
+    Both files are memory-mapped and the matrix is copied block by block,
+        so at most one block of values is held in memory.
+    The result is the same as algorithmic.arrays.rotate_matrix(matrix, k).
+
+    Complexity:
+    - Time: O(M * N).
+    - Space: O(B^2).
+
+    Where M, N are the dimensions of the matrix and B the block size.
+
+    Args:
+        src: path of the matrix to rotate.
+        dst: path where to write the rotated matrix. It can't be the same file as src,
+            since the matrix is not rotated in-place.
+        k: number of 90 degrees clock-wise turns.
+        block_size: side of the blocks that are copied at once.
+    """
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        raise ValueError("src and dst can't be the same file: {}".format(dst))
+
+    typecode, m, n = read_shape(src)
+    turns = k % 4
+
+    rotated_shape = (n, m) if turns % 2 else (m, n)
+    _create(dst, typecode, *rotated_shape)
+
+    if m == 0 or n == 0:
+        return
+
+    with _mapped(src, write=False) as source, _mapped(dst, write=True) as target:
+        for i_start in range(0, m, block_size):
+            i_stop = min(i_start + block_size, m)
+            for j_start in range(0, n, block_size):
+                j_stop = min(j_start + block_size, n)
+
+                block = [
+                    source[i * n + j_start: i * n + j_stop].tolist()
+                    for i in range(i_start, i_stop)
+                ]
+
+                for row, start, values in _rotate_block(
+                        block, turns, m, n, i_start, j_start, i_stop, j_stop):
+                    offset = row * rotated_shape[1] + start
+                    target[offset: offset + len(values)] = array(typecode, values)
+
+
+def set_zeros_file(
+    path: str, block_size: int = DEFAULT_BLOCK_SIZE
+) -> Tuple[List[int], List[int]]:
+    """Modifies a matrix file (in-place), so that if an element of it is zero,
+        its entire row and column are set to zero.
+
+    The file is memory-mapped and scanned in two passes, reading at most B^2 values at a time:
+        the first one finds the rows and columns that contain zeros,
+        and the second one nullifies them.
+    The result is the same as algorithmic.arrays.set_zeros(matrix).
+
+    Complexity:
+    - Time: O(M * N).
+    - Space: O(M + N + B^2).
+
+    Where M, N are the dimensions of the matrix and B the block size.
+
+    Args:
+        path: path of the matrix to modify.
+        block_size: the number of values read at once is block_size ** 2.
+
+    Returns:
+        the indices of the nullified rows and columns, in ascending order.
+    """
+    typecode, m, n = read_shape(path)
+
+    if m == 0 or n == 0:
+        return [], []
+
+    chunk_size = block_size * block_size
+
+    with _mapped(path, write=True) as matrix:
+        zero_rows = bytearray(m)
+        zero_columns = bytearray(n)
+
+        for i in range(m):
+            for j_start, values in _row_chunks(matrix, i, n, chunk_size):
+                if 0 not in values:
+                    continue
+
+                zero_rows[i] = 1
+                for j, value in enumerate(values, j_start):
+                    if value == 0:
+                        zero_columns[j] = 1
+
+        columns = [j for j in range(n) if zero_columns[j]]
+        zeros = array(typecode, bytes(array(typecode).itemsize * min(n, chunk_size)))
+
+        for i in range(m):
+            if zero_rows[i]:
+                for j_start in range(0, n, chunk_size):
+                    j_stop = min(j_start + chunk_size, n)
+                    matrix[i * n + j_start: i * n + j_stop] = zeros[:j_stop - j_start]
+            else:
+                for j in columns:
+                    matrix[i * n + j] = 0
+
+    return [i for i in range(m) if zero_rows[i]], columns
+
+
+def _rotate_block(
+    block: List[List], turns: int, m: int, n: int,
+    i_start: int, j_start: int, i_stop: int, j_stop: int
+) -> Iterator[Tuple[int, int, List]]:
+    # Yields (row, first column, values) segments of the rotated block.
+    if turns == 0:
+        for i, values in enumerate(block, i_start):
+            yield i, j_start, values
+
+    elif turns == 2:
+        for i, values in enumerate(block, i_start):
+            yield m - 1 - i, n - j_stop, values[::-1]
+
+    elif turns == 1:
+        for j, column in enumerate(zip(*block), j_start):
+            yield j, m - i_stop, column[::-1]
+
+    else:
+        for j, column in enumerate(zip(*block), j_start):
+            yield n - 1 - j, i_start, column
+
+
+def _row_chunks(matrix: memoryview, i: int, n: int, chunk_size: int) -> Iterator[Tuple[int, Any]]:
+    for j_start in range(0, n, chunk_size):
+        j_stop = min(j_start + chunk_size, n)
+        yield j_start, matrix[i * n + j_start: i * n + j_stop].tolist()
+
+
+def _pack_header(typecode: str, rows: int, columns: int) -> bytes:
+    return struct.pack(HEADER_FORMAT, MAGIC, typecode.encode('ascii'), rows, columns)
+
+
+def _unpack_header(header: bytes) -> Tuple[str, int, int]:
+    if len(header) != HEADER_SIZE:
+        raise MatrixFileError("File is too short to contain a matrix header.")
+
+    magic, typecode, rows, columns = struct.unpack(HEADER_FORMAT, header)
+
+    if magic != MAGIC:
+        raise MatrixFileError("File is not a matrix file (bad magic number {}).".format(magic))
+
+    return typecode.decode('ascii'), rows, columns
+
+
+def _create(path: str, typecode: str, rows: int, columns: int) -> None:
+    itemsize = array(typecode).itemsize
+
+    with open(path, 'wb') as f:
+        f.write(_pack_header(typecode, rows, columns))
+        f.truncate(HEADER_SIZE + rows * columns * itemsize)
+
+
+@contextmanager
+def _mapped(path: str, write: bool) -> Iterator[memoryview]:
+    # Yields a flat memoryview of the values in a matrix file, typed by its typecode.
+    typecode, _, _ = read_shape(path)
+    access = mmap.ACCESS_WRITE if write else mmap.ACCESS_READ
+
+    with open(path, 'r+b' if write else 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=access) as mapped:
+            with memoryview(mapped) as buffer, buffer[HEADER_SIZE:] as data:
+                with data.cast(typecode) as values:
+                    yield values
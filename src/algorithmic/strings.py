@@ -1,36 +1,71 @@
 """Algorithms for string manipulation."""
 
-from typing import Generator
+import math
+import mmap
+import re
+import sys
+from collections import Counter
+from typing import (
+    IO, Any, BinaryIO, Dict, FrozenSet, Generator, Iterable, Iterator, List, Tuple, Union
+)
 
 ASCII_MAX_LENGTH = 128
+UNICODE_MAX_LENGTH = sys.maxunicode + 1
 ASCII_EMPTY_SPACE = 32
+ASCII_LOWERCASE = bytes(range(256)).lower()
 
+PERCENT_ESCAPE = b'% '
+DEFAULT_CHUNK_SIZE = 64 * 1024
 
-def unique(string: str) -> bool:
-    """Checks if an ASCII string has all unique characters.
+TEXT_RUN_PATTERN = re.compile(r'(.)\1*', re.DOTALL)
+BYTES_RUN_PATTERN = re.compile(rb'(.)\1*', re.DOTALL)
+
+UNIQUE_METHODS = ['set', 'bitvector']
+PERMUTATION_METHODS = ['count', 'sort']
+
+
+def unique(string: str, method: str = 'set', unicode: bool = False) -> bool:
+    """Checks if a string has all unique characters.
+
+    Methods:
+    - set: keeps the seen characters in a set.
+    - bitvector: keeps one bit per code point, up to the biggest code point in the string.
+        Uses eight times less space than a boolean array, e.g., 16 bytes for ASCII strings.
+        It is slower than the set method in CPython, since each check is done in bytecode.
 
     Complexity:
     - Time: O(N).
     - Space: O(1).
 
     Where N is the length of the string.
-    Since we have a fixed maximum for N, we could also think the time complexity as O(1).
+    Since we have a fixed maximum for N (the size of the alphabet),
+        we could also think the time complexity as O(1).
 
     Notes:
 
-    1. We can reduce our space usage by a factor of eight by using a bit vector (TODO).
-    2. If can't use additional data structures like set(), these are alternative implementations:
+    1. If can't use additional data structures like set(), these are alternative implementations:
         - Compare every character of the string to every other character of the string.
             - Time: 0(N^2)
             - Space: 0(1).
         - If we are allowed to modify the input string:
             - Sort the string and linearly check for neighboring characters that are identical.
             - Time: O(N * log(N)) (the sorting part).
+
+    Args:
+        string: the string to check.
+        method: the algorithm to use. One of UNIQUE_METHODS.
+        unicode: if False, the string is assumed to be ASCII.
+            Otherwise, the whole Unicode range is supported.
     """
+    if method not in UNIQUE_METHODS:
+        raise ValueError("Method {} not valid. Choose from {}".format(method, UNIQUE_METHODS))
 
-    if len(string) > ASCII_MAX_LENGTH:
+    if len(string) > _alphabet_length(unicode):
         return False
 
+    if method == 'bitvector':
+        return _unique_bitvector(string)
+
     chars = set()
     for char in string:
         if char in chars:
@@ -41,28 +76,135 @@ def unique(string: str) -> bool:
     return True
 
 
-def check_permutation(s1: str, s2: str) -> bool:
-    """Given two ASCII strings, checks if one is a permutation of the other.
+def _unique_bitvector(string: str) -> bool:
+    if not string:
+        return True
 
-    The algorithm is case-sensitive.
+    bits = bytearray(max(map(ord, string)) // 8 + 1)
+
+    for char in string:
+        code = ord(char)
+        byte = code >> 3
+        mask = 1 << (code & 7)
+
+        if bits[byte] & mask:
+            return False
+
+        bits[byte] |= mask
+
+    return True
+
+
+def unique_many(strings: Iterable[str], unicode: bool = False) -> Iterator[bool]:
+    """Checks, for each string of an iterable, if it has all unique characters.
+
+    Equivalent to map(unique, strings), but much faster on big batches of short strings,
+        like identifiers, since each string is checked by building a set with a single call.
 
     Complexity:
-    - Time: O(N * log(N)).
-    - Space: O(N).
+    - Time: O(N).
+    - Space: O(1).
 
-    Where N = max(A, B) and A, B are the lengths of the strings s1 and s2, respectively.
+    Where N is the total length of the strings.
+
+    Args:
+        strings: the strings to check.
+        unicode: if False, the strings are assumed to be ASCII.
+            Otherwise, the whole Unicode range is supported.
 
-    This is not the most time efficient algorithm.
-        If we calculate character counts in each string and compare, we can reach O(N).
+    Returns:
+        an iterator of booleans, one for each string.
+    """
+    limit = _alphabet_length(unicode)
+
+    return (len(s) <= limit and len(set(s)) == len(s) for s in strings)
+
+
+def _alphabet_length(unicode: bool) -> int:
+    return UNICODE_MAX_LENGTH if unicode else ASCII_MAX_LENGTH
+
+
+def check_permutation(s1: str, s2: str, method: str = 'count') -> bool:
+    """Given two strings, checks if one is a permutation of the other.
+
+    The algorithm is case-sensitive.
+
+    Methods:
+    - count: compares the character counts of both strings.
+        - Time: O(N).
+        - Space: O(1).
+    - sort: compares the sorted strings.
+        - Time: O(N * log(N)).
+        - Space: O(N).
+
+    Where N = max(A, B) and A, B are the lengths of the strings s1 and s2, respectively.
+    The space of the count method is bounded by the size of the alphabet.
 
     Args:
         s1: first string.
         s2: second string.
+        method: the algorithm to use. One of PERMUTATION_METHODS.
     """
+    if method not in PERMUTATION_METHODS:
+        raise ValueError("Method {} not valid. Choose from {}".format(method, PERMUTATION_METHODS))
+
     if len(s1) != len(s2):
         return False
 
-    return sorted(s1) == sorted(s2)  # TODO: implement TimSort.
+    if method == 'sort':
+        return sorted(s1) == sorted(s2)  # TODO: implement TimSort.
+
+    return Counter(s1) == Counter(s2)
+
+
+def signature(string: str) -> FrozenSet[Tuple[str, int]]:
+    """Returns the character counts of a string, as a hashable object.
+
+    Two strings have the same signature if and only if one is a permutation of the other.
+
+    Complexity:
+    - Time: O(N).
+    - Space: O(1).
+
+    Where N is the length of the string (the space is bounded by the size of the alphabet).
+    """
+    return frozenset(Counter(string).items())
+
+
+class AnagramIndex:
+    """Groups the words of a corpus by their signature, so that words that are permutations
+        of each other (anagrams) end up in the same group.
+
+    Building the index takes O(N) time, where N is the total length of the words,
+        and checking if a word is a permutation of any word in the index takes O(L) time,
+        where L is the length of the word.
+
+    Args:
+        words: the corpus of words to index.
+    """
+    def __init__(self, words: Iterable[str] = ()) -> None:
+        self._groups = {}
+
+        for word in words:
+            self.add(word)
+
+    def __len__(self) -> int:
+        return len(self._groups)
+
+    def __contains__(self, word: str) -> bool:
+        return signature(word) in self._groups
+
+    def add(self, word: str) -> None:
+        """Adds a word to the index."""
+        self._groups.setdefault(signature(word), []).append(word)
+
+    def anagrams(self, word: str) -> List[str]:
+        """Returns the words of the index that are permutations of the provided word."""
+        return list(self._groups.get(signature(word), []))
+
+    def groups(self) -> List[List[str]]:
+        """Returns the groups of anagrams, in order of insertion."""
+        return [list(group) for group in self._groups.values()]
 
 
 def urlify(string: bytearray, true_length: int) -> None:
@@ -104,6 +246,135 @@ def urlify(string: bytearray, true_length: int) -> None:
         i -= 1
 
 
+def percent_encoding_table(escape: bytes = PERCENT_ESCAPE) -> List[bytes]:
+    """Returns a 256-entry table that maps every byte to its percent-encoded form.
+
+    Bytes that are not escaped map to themselves.
+
+    Args:
+        escape: the bytes to escape.
+    """
+    table = [bytes([byte]) for byte in range(256)]
+
+    for byte in escape:
+        table[byte] = b'%%%02X' % byte
+
+    return table
+
+
+def percent_encode(
+    data: Union[bytes, memoryview, BinaryIO, Iterable[bytes]],
+    escape: bytes = PERCENT_ESCAPE,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Generator[bytes, None, None]:
+    """Percent-encodes a stream of bytes, i.e., replaces each byte in escape by '%XX',
+        where XX is the hexadecimal value of the byte. Generalizes urlify.
+
+    The stream is processed by chunks, so the memory used is bounded by the chunk size.
+    The escaped bytes are found with a regular expression, and replaced using a lookup table.
+
+    If the '%' byte is not escaped, percent_decode is not guaranteed to be the inverse.
+
+    Complexity:
+    - Time: O(N).
+    - Space: O(C).
+
+    Where N is the length of the stream and C the chunk size.
+
+    Args:
+        data: a bytes-like object, a binary file object or an iterable of chunks.
+        escape: the bytes to escape.
+        chunk_size: the size of the chunks in which buffers and files are read.
+
+    Returns:
+        generator for the encoded chunks.
+    """
+    table = percent_encoding_table(escape)
+
+    if not escape:
+        yield from iter_chunks(data, chunk_size)
+        return
+
+    pattern = re.compile(b'[' + b''.join(re.escape(bytes([byte])) for byte in escape) + b']')
+
+    def replace(match):
+        return table[match.group()[0]]
+
+    for chunk in iter_chunks(data, chunk_size):
+        yield pattern.sub(replace, chunk)
+
+
+def percent_decode(
+    data: Union[bytes, memoryview, BinaryIO, Iterable[bytes]],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Generator[bytes, None, None]:
+    """Decodes a percent-encoded stream of bytes, i.e., replaces each '%XX' by the byte
+        with hexadecimal value XX. Invalid sequences are left untouched.
+
+    The stream is processed by chunks, so the memory used is bounded by the chunk size.
+        A sequence split between two chunks is carried to the next one.
+
+    Complexity:
+    - Time: O(N).
+    - Space: O(C).
+
+    Where N is the length of the stream and C the chunk size.
+
+    Args:
+        data: a bytes-like object, a binary file object or an iterable of chunks.
+        chunk_size: the size of the chunks in which buffers and files are read.
+
+    Returns:
+        generator for the decoded chunks.
+    """
+    pattern = re.compile(b'%[0-9A-Fa-f]{2}')
+
+    def replace(match):
+        return bytes([int(match.group()[1:], 16)])
+
+    carry = b''
+    for chunk in iter_chunks(data, chunk_size):
+        chunk = carry + chunk
+
+        start = chunk.rfind(b'%', max(len(chunk) - 2, 0))
+        if start == -1:
+            carry = b''
+        else:
+            chunk, carry = chunk[:start], chunk[start:]
+
+        yield pattern.sub(replace, chunk)
+
+    if carry:
+        yield carry
+
+
+def iter_chunks(
+    data: Union[str, bytes, memoryview, IO, Iterable], chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Generator[Any, None, None]:
+    """Splits a stream into chunks.
+
+    Args:
+        data: a string, a bytes-like object, a file object or an iterable of chunks,
+            which are returned as they are.
+        chunk_size: the size of the chunks in which strings, buffers and files are read.
+
+    Returns:
+        generator for the chunks.
+    """
+    if isinstance(data, (str, bytes, bytearray, memoryview)):
+        for start in range(0, len(data), chunk_size):
+            yield data[start:start + chunk_size]
+
+    elif hasattr(data, 'read'):
+        chunk = data.read(chunk_size)
+        while chunk:
+            yield chunk
+            chunk = data.read(chunk_size)
+
+    else:
+        yield from data
+
+
 def permutations(string: str) -> Generator[str, None, None]:
     """Generates all possible permutations of a string.
 
@@ -125,7 +396,183 @@ def permutations(string: str) -> Generator[str, None, None]:
                 yield c + perm
 
 
-def palindrome_permutation(string: str) -> bool:
+def unique_permutations(
+    string: str, start: int = 0, stop: int = None
+) -> Generator[str, None, None]:
+    """Generates the distinct permutations of a string, in lexicographic order.
+
+    Unlike permutations, repeated characters don't produce repeated permutations,
+        and the permutations are generated iteratively, rearranging a single list of characters.
+    The start and stop ranks allow to generate any range of the permutations,
+        e.g., to split the work between independent workers (see permutation_ranges).
+
+    Complexity (exercising the full generator):
+    - Time: O(P * N).
+    - Space: O(N).
+
+    Where P is the number of distinct permutations and N the length of the string.
+    The amortized cost of each next permutation is O(1), but joining it into a string is O(N).
+
+    Args:
+        string: the string to do permutations with.
+        start: the rank of the first permutation to generate.
+        stop: the rank after the last permutation to generate. Defaults to all permutations.
+            If it's not greater than start, nothing is generated.
+
+    Returns:
+        generator for the permutations.
+
+    Raises:
+        ValueError: if start or stop are not in [0, P].
+    """
+    total = count_permutations(string)
+
+    if stop is None:
+        stop = total
+
+    if not (0 <= start <= total and 0 <= stop <= total):
+        raise ValueError(
+            "start and stop must be in [0, {}], got {} and {}".format(total, start, stop))
+
+    if start >= stop:
+        return
+
+    chars = list(unrank(string, start))
+
+    for _ in range(stop - start):
+        yield ''.join(chars)
+        next_permutation(chars)
+
+
+def next_permutation(chars: List[str]) -> bool:
+    """Rearranges (in-place) a list of characters into the next permutation
+        in lexicographic order.
+
+    Complexity:
+    - Time: O(N).
+    - Space: O(1).
+
+    Returns:
+        False if chars was the last permutation, in which case it is rearranged into the first one.
+    """
+    i = len(chars) - 2
+    while i >= 0 and chars[i] >= chars[i + 1]:
+        i -= 1
+
+    if i >= 0:
+        j = len(chars) - 1
+        while chars[j] <= chars[i]:
+            j -= 1
+
+        chars[i], chars[j] = chars[j], chars[i]
+
+    chars[i + 1:] = reversed(chars[i + 1:])
+
+    return i >= 0
+
+
+def count_permutations(string: str) -> int:
+    """Returns the number of distinct permutations of a string.
+
+    Complexity:
+    - Time: O(N).
+    - Space: O(1).
+    """
+    total = math.factorial(len(string))
+
+    for count in Counter(string).values():
+        total //= math.factorial(count)
+
+    return total
+
+
+def rank(permutation: str) -> int:
+    """Returns the position of a permutation in the lexicographic order of the
+        distinct permutations of its characters.
+
+    Complexity:
+    - Time: O(N * A).
+    - Space: O(A).
+
+    Where A is the number of distinct characters.
+    """
+    counts = Counter(permutation)
+    chars = sorted(counts)
+    total = count_permutations(permutation)
+
+    position = 0
+    for remaining, char in zip(range(len(permutation), 0, -1), permutation):
+        smaller = 0
+        for c in chars:
+            if c == char:
+                break
+
+            smaller += counts[c]
+
+        position += total * smaller // remaining
+        total = total * counts[char] // remaining
+        counts[char] -= 1
+
+    return position
+
+
+def unrank(string: str, k: int) -> str:
+    """Returns the permutation at position k in the lexicographic order of the
+        distinct permutations of a string. It is the inverse of rank.
+
+    Complexity:
+    - Time: O(N * A).
+    - Space: O(N + A).
+
+    Where A is the number of distinct characters.
+    """
+    total = count_permutations(string)
+
+    if not 0 <= k < max(total, 1):
+        raise ValueError("k must be in [0, {}), got {}".format(total, k))
+
+    counts = Counter(string)
+    chars = sorted(counts)
+
+    permutation = []
+    for remaining in range(len(string), 0, -1):
+        for c in chars:
+            block = total * counts[c] // remaining
+            if k < block:
+                break
+
+            k -= block
+
+        permutation.append(c)
+        total = block
+        counts[c] -= 1
+
+    return ''.join(permutation)
+
+
+def permutation_ranges(string: str, parts: int) -> List[Tuple[int, int]]:
+    """Splits the distinct permutations of a string into contiguous ranges of ranks
+        of (almost) equal size. Each range can be generated independently with
+        unique_permutations(string, start, stop).
+
+    Args:
+        string: the string to do permutations with.
+        parts: the maximum number of ranges.
+
+    Returns:
+        the list of (start, stop) ranges.
+    """
+    total = count_permutations(string)
+    parts = min(parts, total)
+
+    bounds = [total * i // parts for i in range(parts + 1)]
+
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def palindrome_permutation(
+    string: Union[str, IO, Iterable[str]], chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> bool:
     """Checks if a string is a palindrome permutation.
 
     In here, a palindrome is a word or phrase that,
@@ -135,37 +582,149 @@ def palindrome_permutation(string: str) -> bool:
         at the most 1 character has an odd count of occurrences
         (the one in the middle for an odd string).
 
+    The string is processed in a single pass, by chunks, keeping only the set of characters
+        with an odd count so far. The characters of each chunk are counted in C with a Counter,
+        and only the distinct characters are lowercased, so the string is never copied.
+
+    Complexity:
+    - Time: O(N).
+    - Space: O(A + C).
+
+    Where A is the size of the alphabet and C the chunk size.
+
+    Args:
+        string: a string, a text file object or an iterable of chunks.
+        chunk_size: the size of the chunks in which strings and files are read.
+    """
+    odd = set()
+
+    for chunk in iter_chunks(string, chunk_size):
+        for char, count in Counter(chunk).items():
+            if count % 2 == 0 or char == ' ':
+                continue
+
+            char = char.lower()
+            if char in odd:
+                odd.remove(char)
+            else:
+                odd.add(char)
+
+    return len(odd) <= 1
+
+
+def is_palindrome(string: Union[str, bytes, mmap.mmap]) -> bool:
+    """Checks if a string is a palindrome, ignoring spaces and case.
+
+    Two pointers walk the string from both ends, skipping spaces and lowercasing
+        each pair of characters as they are compared, so the string is never copied.
+    Besides strings, it accepts ASCII bytes-like objects,
+        e.g., a memory-mapped file (see the mmap module).
+
+    Complexity:
+        Time: O(N).
+        Space: O(1).
+    """
+    if isinstance(string, str):
+        space = ' '
+        lower = str.lower
+    else:
+        space = ASCII_EMPTY_SPACE
+        lower = ASCII_LOWERCASE.__getitem__
+
+    i = 0
+    j = len(string) - 1
+
+    while i < j:
+        if string[i] == space:
+            i += 1
+        elif string[j] == space:
+            j -= 1
+        elif lower(string[i]) != lower(string[j]):
+            return False
+        else:
+            i += 1
+            j -= 1
+
+    return True
+
+
+def longest_palindromic_substring(string: str) -> str:
+    """Returns the longest substring that is a palindrome. If more than one, first is returned.
+
+    Uses Manacher's algorithm (see palindromic_radii).
+
     Complexity:
     - Time: O(N).
     - Space: O(N).
     """
+    odd, even = palindromic_radii(string)
 
-    string = string.replace(" ", "")
-    string = string.lower()
+    start, length = 0, 0
+    for i in range(len(string)):
+        if 2 * odd[i] - 1 > length:
+            start, length = i - odd[i] + 1, 2 * odd[i] - 1
 
-    occurrences = {k: 0 for k in set(string)}
+        if 2 * even[i] > length:
+            start, length = i - even[i], 2 * even[i]
 
-    for char in string:
-        occurrences[char] += 1
+    return string[start:start + length]
+
+
+def count_palindromic_substrings(string: str) -> int:
+    """Counts the substrings that are palindromes (by position, so repeated ones count again).
 
-    odd_counts = 0
-    for count in occurrences.values():
-        odd_counts += count % 2
+    Uses Manacher's algorithm (see palindromic_radii).
+
+    Complexity:
+    - Time: O(N).
+    - Space: O(N).
+    """
+    odd, even = palindromic_radii(string)
+
+    return sum(odd) + sum(even)
 
-    return odd_counts <= 1
 
+def palindromic_radii(string: str) -> Tuple[List[int], List[int]]:
+    """Computes, with Manacher's algorithm, the radius of the longest palindrome
+        centered at each position of a string.
 
-def is_palindrome(string: str) -> bool:
-    """Checks if a string is a palindrome.
+    The palindromes found so far that reach furthest to the right are used as mirrors:
+        the radius at position i starts from the radius at its mirror position,
+        so each character is compared again only when it extends the rightmost palindrome.
 
     Complexity:
-        Time: O(N).
-        Space: O(N).
+    - Time: O(N).
+    - Space: O(N).
+
+    Returns:
+        two lists. The first one has the number of odd palindromes centered at each position,
+            and the second one the number of even palindromes centered just before it.
     """
-    string = string.replace(" ", "")
-    string = string.lower()
+    n = len(string)
+
+    odd = [0] * n
+    left, right = 0, -1
+    for i in range(n):
+        k = 1 if i > right else min(odd[left + right - i], right - i + 1)
+        while i - k >= 0 and i + k < n and string[i - k] == string[i + k]:
+            k += 1
 
-    return string == string[::-1]
+        odd[i] = k
+        if i + k - 1 > right:
+            left, right = i - k + 1, i + k - 1
+
+    even = [0] * n
+    left, right = 0, -1
+    for i in range(n):
+        k = 0 if i > right else min(even[left + right - i + 1], right - i + 1)
+        while i - k - 1 >= 0 and i + k < n and string[i - k - 1] == string[i + k]:
+            k += 1
+
+        even[i] = k
+        if i + k - 1 > right:
+            left, right = i - k, i + k - 1
+
+    return odd, even
 
 
 def one_away(s1: str, s2: str) -> bool:
@@ -173,27 +732,33 @@ def one_away(s1: str, s2: str) -> bool:
     The possible modifications of a string are insert a character,
         remove a character and replace a character.
 
+    Both strings are walked with two pointers, which skip the single allowed mismatch.
+
     Complexity:
     - Time: O(N).
-    - Space: O(N).
+    - Space: O(1).
     """
 
     def one_insert_away(s1, s2):
-        not_in_s2 = [char for char in s1 if char not in s2]
+        # s1 has one character more than s2.
+        i = 0
+        while i < len(s2) and s1[i] == s2[i]:
+            i += 1
 
-        if len(not_in_s2) == 1:
-            s1_copy = s1.replace(not_in_s2[0], "")
-            return s1_copy == s2
+        while i < len(s2) and s1[i + 1] == s2[i]:  # skip the inserted character.
+            i += 1
 
-        return False
+        return i == len(s2)
 
     def one_replace_away(s1, s2):
         diffs = 0
-        for i, char in enumerate(s1):
-            if char != s2[i]:
+        for c1, c2 in zip(s1, s2):
+            if c1 != c2:
                 diffs += 1
+                if diffs > 1:
+                    return False
 
-        return not diffs > 1
+        return True
 
     def one_remove_away(s1, s2):
         return one_insert_away(s2, s1)  # swap strings, so insert becomes remove.
@@ -210,23 +775,159 @@ def one_away(s1: str, s2: str) -> bool:
     return False
 
 
-def compression(string: str) -> str:
-    """Performs compression of a string by counting repeated characters."""
+def edit_distance(s1: str, s2: str, max_distance: int = None) -> int:
+    """Computes the Levenshtein distance between two strings, i.e., the minimum number of
+        insertions, removals and replacements of characters that transform s1 into s2.
+
+    If max_distance is provided, only the band of the dynamic programming matrix
+        with cells at most max_distance away from the diagonal is computed,
+        since any path that leaves the band costs more than max_distance.
 
-    current_char = string[0]
-    count = 1
+    Complexity:
+    - Time: O(N * K).
+    - Space: O(M).
 
-    compressed = ""
+    Where N, M are the lengths of s1 and s2, and K is max_distance (or M if not provided).
 
-    for char in string[1:]:
-        if char == current_char:
-            count += 1
-        else:
-            compressed += f"{current_char}{count}"
-            current_char = char
-            count = 1
+    Args:
+        s1: first string.
+        s2: second string.
+        max_distance: the maximum distance of interest.
+
+    Returns:
+        the distance, or max_distance + 1 if the distance is bigger than max_distance.
+    """
+    n = len(s1)
+    m = len(s2)
+    k = max(n, m) if max_distance is None else max_distance
+
+    if abs(n - m) > k:
+        return k + 1
+
+    beyond = k + 1
+    previous = list(range(m + 1))
+    current = [beyond] * (m + 1)
+
+    for i in range(1, n + 1):
+        low = max(1, i - k)
+        high = min(m, i + k)
+
+        current[low - 1] = i if low == 1 else beyond
+        if high < m:
+            current[high + 1] = beyond  # read by the next row, outside of this band.
+
+        best = current[low - 1]
+        c1 = s1[i - 1]
+        for j in range(low, high + 1):
+            cost = min(
+                previous[j - 1] + (c1 != s2[j - 1]),  # replace (or match).
+                previous[j] + 1,  # remove.
+                current[j - 1] + 1,  # insert.
+            )
+            current[j] = cost
+            if cost < best:
+                best = cost
+
+        if best > k:
+            return beyond
+
+        previous, current = current, previous
+
+    return min(previous[m], beyond)
+
+
+def within_k_edits(s1: str, s2: str, k: int) -> bool:
+    """Checks if s2 is at most k modifications away from s1 (see edit_distance).
+
+    Complexity:
+    - Time: O(N * K).
+    - Space: O(M).
+    """
+    return edit_distance(s1, s2, max_distance=k) <= k
+
+
+class BKTree:
+    """A Burkhard-Keller tree, which indexes words by their edit distance to find
+        the words that are close to a query without comparing it to every word.
+
+    Each child of a node is at a different distance from it. By the triangle inequality,
+        the words within k edits of the query can only be under the children at distance
+        d - k to d + k, where d is the distance from the query to the node.
+
+    Args:
+        words: the words to index.
+    """
+    def __init__(self, words: Iterable[str] = ()) -> None:
+        self._root = None
+        self._size = 0
+
+        for word in words:
+            self.add(word)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, word: str) -> None:
+        """Adds a word to the tree.
+
+        Complexity:
+        - Time: O(H * L^2).
+
+        Where H is the height of the tree and L the length of the words.
+        """
+        if self._root is None:
+            self._root = (word, {})
+            self._size += 1
+            return
+
+        node_word, children = self._root
+        while True:
+            distance = edit_distance(word, node_word)
+            if distance == 0:
+                return
+
+            if distance not in children:
+                children[distance] = (word, {})
+                self._size += 1
+                return
+
+            node_word, children = children[distance]
+
+    def search(self, word: str, k: int) -> List[Tuple[str, int]]:
+        """Returns the words of the tree within k edits of the provided word,
+            with their distances, closest first.
+        """
+        if self._root is None:
+            return []
+
+        found = []
+        pending = [self._root]
 
-    compressed += f"{current_char}{count}"
+        while pending:
+            node_word, children = pending.pop()
+
+            distance = edit_distance(word, node_word)
+            if distance <= k:
+                found.append((node_word, distance))
+
+            for child_distance, child in children.items():
+                if distance - k <= child_distance <= distance + k:
+                    pending.append(child)
+
+        return sorted(found, key=lambda item: (item[1], item[0]))
+
+
+def compression(string: str) -> str:
+    """Performs compression of a string by counting repeated characters.
+
+    The compressed string is built by joining a list of runs, instead of concatenating
+        to a string, which may copy the whole compressed string on each run.
+
+    Complexity:
+    - Time: O(N).
+    - Space: O(N).
+    """
+    compressed = ''.join(f"{char}{count}" for char, count in runs(string))
 
     if len(string) == len(compressed):
         return string
@@ -234,18 +935,259 @@ def compression(string: str) -> str:
     return compressed
 
 
-def rotation(s1: str, s2: str) -> str:
+def runs(
+    data: Union[str, bytes, memoryview, IO, Iterable], chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Generator[Tuple[Union[str, bytes], int], None, None]:
+    """Splits a stream into runs of repeated characters (or bytes).
+
+    The runs inside each chunk are found with a regular expression,
+        and runs split between chunks are merged.
+
+    Complexity:
+    - Time: O(N).
+    - Space: O(C).
+
+    Where N is the length of the stream and C the chunk size.
+
+    Args:
+        data: a string, a bytes-like object, a file object or an iterable of chunks.
+        chunk_size: the size of the chunks in which strings, buffers and files are read.
+
+    Returns:
+        generator for the (character, count) runs.
+    """
+    symbol = None
+    count = 0
+
+    for chunk in iter_chunks(data, chunk_size):
+        pattern = TEXT_RUN_PATTERN if isinstance(chunk, str) else BYTES_RUN_PATTERN
+
+        for match in pattern.finditer(chunk):
+            char = match.group(1)
+            length = match.end() - match.start()
+
+            if char == symbol:
+                count += length
+                continue
+
+            if count:
+                yield symbol, count
+
+            symbol = char
+            count = length
+
+    if count:
+        yield symbol, count
+
+
+def rle_encode(
+    data: Union[str, bytes, memoryview, IO, Iterable],
+    buffer: BinaryIO,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> None:
+    """Run-length encodes a stream of characters or bytes into a binary buffer.
+
+    Each run is written as its symbol (UTF-8 encoded, for characters)
+        followed by its count as a variable-length integer (LEB128):
+        7 bits per byte, with the highest bit set on every byte but the last.
+        Counts below 128 take a single byte.
+
+    Complexity:
+    - Time: O(N).
+    - Space: O(C).
+
+    Where N is the length of the stream and C the chunk size.
+
+    Args:
+        data: a string, a bytes-like object, a file object or an iterable of chunks.
+        buffer: the binary buffer, e.g., a file object or io.BytesIO, to write to.
+        chunk_size: the size of the chunks in which the stream is read and written.
+    """
+    encoded = bytearray()
+
+    for symbol, count in runs(data, chunk_size):
+        encoded += symbol.encode('utf-8') if isinstance(symbol, str) else symbol
+
+        while count >= 0x80:
+            encoded.append(count & 0x7F | 0x80)
+            count >>= 7
+
+        encoded.append(count)
+
+        if len(encoded) >= chunk_size:
+            buffer.write(encoded)
+            encoded.clear()
+
+    buffer.write(encoded)
+
+
+def rle_decode(
+    data: Union[bytes, memoryview, BinaryIO, Iterable[bytes]],
+    buffer: IO,
+    text: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> None:
+    """Decodes a stream encoded with rle_encode into a buffer.
+
+    Complexity:
+    - Time: O(N + M).
+    - Space: O(C).
+
+    Where N is the length of the encoded stream, M the length of the decoded one
+        and C the chunk size.
+
+    Args:
+        data: a bytes-like object, a binary file object or an iterable of chunks.
+        buffer: the buffer to write to. A text buffer (e.g., io.StringIO) if text is True,
+            a binary one otherwise.
+        text: whether the encoded stream contains characters or bytes.
+        chunk_size: the size of the chunks in which the stream is read and written.
+    """
+    symbol = bytearray()
+    symbol_length = 1
+    count = 0
+    shift = 0
+
+    def write(symbol, count):
+        if text:
+            symbol = symbol.decode('utf-8')
+        else:
+            symbol = bytes(symbol)
+
+        per_write = max(chunk_size // len(symbol), 1)
+        while count > 0:
+            buffer.write(symbol * min(count, per_write))
+            count -= per_write
+
+    for chunk in iter_chunks(data, chunk_size):
+        for byte in chunk:
+            if len(symbol) < symbol_length:
+                if not symbol and text:
+                    symbol_length = _utf8_length(byte)
+
+                symbol.append(byte)
+                continue
+
+            count |= (byte & 0x7F) << shift
+            shift += 7
+
+            if byte < 0x80:
+                write(symbol, count)
+                symbol.clear()
+                symbol_length = 1
+                count = 0
+                shift = 0
+
+    if symbol:
+        raise ValueError("Encoded stream is truncated.")
+
+
+def _utf8_length(lead_byte: int) -> int:
+    if lead_byte < 0xC0:
+        return 1
+
+    if lead_byte < 0xE0:
+        return 2
+
+    if lead_byte < 0xF0:
+        return 3
+
+    return 4
+
+
+def rotation(s1: str, s2: str) -> bool:
     """Checks if string s2 is a rotation of string s1, e.g.,
         "erbottlewat" is a rotation of "waterbottle".
 
+    Instead of searching s1 in s2 + s2, which builds a string of length 2N,
+        both strings are compared character by character from their minimal rotations,
+        which are equal if and only if they are rotations of each other.
+
     Complexity:
-    - Time: O(A + B).
-    - Space: O(A + B).
+    - Time: O(N).
+    - Space: O(1).
 
-    Where A, B are the lengths of s1 and s2, respectively,
-        assuming sub-string check has O(A + B) time.
+    Where N is the length of the strings.
     """
     if len(s1) != len(s2) or len(s1) == 0:
         return False
 
-    return s1 in ''.join([s2, s2])
+    n = len(s1)
+    i = minimal_rotation(s1)
+    j = minimal_rotation(s2)
+
+    for k in range(n):
+        if s1[(i + k) % n] != s2[(j + k) % n]:
+            return False
+
+    return True
+
+
+def minimal_rotation(string: str) -> int:
+    """Returns the index where the lexicographically minimal rotation of a string starts.
+
+    Two candidate starting indices i and j are compared character by character.
+        When they differ at offset k, the bigger candidate and the k following ones
+        can't start the minimal rotation, so it is moved past them.
+    This is an O(1) space alternative to Booth's algorithm, which needs a failure table.
+
+    Complexity:
+    - Time: O(N).
+    - Space: O(1).
+    """
+    n = len(string)
+    i, j, k = 0, 1, 0
+
+    while i < n and j < n and k < n:
+        a = string[(i + k) % n]
+        b = string[(j + k) % n]
+
+        if a == b:
+            k += 1
+            continue
+
+        if a > b:
+            i += k + 1
+        else:
+            j += k + 1
+
+        if i == j:
+            j += 1
+
+        k = 0
+
+    return min(i, j)
+
+
+def canonical_rotation(string: str) -> str:
+    """Returns the lexicographically minimal rotation of a string.
+
+    Two strings are rotations of each other if and only if their canonical rotations are equal.
+
+    Complexity:
+    - Time: O(N).
+    - Space: O(N).
+    """
+    i = minimal_rotation(string)
+
+    return string[i:] + string[:i]
+
+
+def group_rotations(strings: Iterable[str]) -> Dict[str, List[str]]:
+    """Groups strings into classes of strings that are rotations of each other.
+
+    Complexity:
+    - Time: O(N).
+    - Space: O(N).
+
+    Where N is the total length of the strings.
+
+    Returns:
+        a dictionary from each canonical rotation to the strings in its class.
+    """
+    groups = {}
+
+    for string in strings:
+        groups.setdefault(canonical_rotation(string), []).append(string)
+
+    return groups
@@ -1,3 +1,5 @@
+import random
+
 import pytest
 
 from algorithmic import arrays
@@ -22,6 +24,64 @@ def test_rotate_matrix():
     arrays.rotate_matrix(matrix)
     assert matrix == [[7, 4, 1], [8, 5, 2], [9, 6, 3]]
 
+    with pytest.raises(ValueError):
+        arrays.rotate_matrix(matrix, method='invalid')
+
+
+def test_rotate_matrix_turns():
+    original = [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
+    expected = {
+        1: [[7, 4, 1], [8, 5, 2], [9, 6, 3]],
+        2: [[9, 8, 7], [6, 5, 4], [3, 2, 1]],
+        3: [[3, 6, 9], [2, 5, 8], [1, 4, 7]],
+        4: original,
+    }
+
+    for method in arrays.ROTATION_METHODS:
+        for k, output in expected.items():
+            matrix = [row[:] for row in original]
+            arrays.rotate_matrix(matrix, k=k, method=method)
+            assert matrix == output
+
+            matrix = [row[:] for row in original]
+            arrays.rotate_matrix(matrix, k=-k, method=method)
+            assert matrix == expected[(4 - k) % 4 or 4]
+
+    matrix = []
+    arrays.rotate_matrix(matrix)
+    assert matrix == []
+
+
+def test_rotate_matrix_rectangular():
+    for method in ['zip', 'tiles']:
+        matrix = [[1, 2, 3], [4, 5, 6]]
+        arrays.rotate_matrix(matrix, method=method)
+        assert matrix == [[4, 1], [5, 2], [6, 3]]
+
+        matrix = [[1, 2, 3], [4, 5, 6]]
+        arrays.rotate_matrix(matrix, k=2, method=method)
+        assert matrix == [[6, 5, 4], [3, 2, 1]]
+
+        matrix = [[1, 2, 3], [4, 5, 6]]
+        arrays.rotate_matrix(matrix, k=-1, method=method)
+        assert matrix == [[3, 6], [2, 5], [1, 4]]
+
+
+def test_rotate_matrix_tiles():
+    original = [list(range(i * 7, (i + 1) * 7)) for i in range(5)]
+
+    for k in range(1, 4):
+        expected = [row[:] for row in original]
+        arrays.rotate_matrix(expected, k=k, method='zip')
+
+        for block_size in [1, 2, 3, 8]:
+            matrix = [row[:] for row in original]
+            arrays.rotate_matrix(matrix, k=k, method='tiles', block_size=block_size)
+            assert matrix == expected
+
+    assert arrays.default_block_size() == 32
+    assert arrays.default_block_size(cache_size=1024) == 8
+
 
 def test_zero_matrix():
     matrix = [[1, 2], [3, 4]]
@@ -43,3 +103,51 @@ def test_zero_matrix():
     matrix = [[1, 0, 3], [0, 5, 6], [7, 8, 9]]
     arrays.set_zeros(matrix)
     assert matrix == [[0, 0, 0], [0, 0, 0], [0, 0, 9]]
+
+
+def test_zero_matrix_methods():
+    with pytest.raises(ValueError):
+        arrays.set_zeros([[1]], method='invalid')
+
+    for method in arrays.ZEROS_METHODS:
+        assert arrays.set_zeros([], method=method) == ([], [])
+
+        matrix = [[1, 2], [3, 4]]
+        assert arrays.set_zeros(matrix, method=method) == ([], [])
+        assert matrix == [[1, 2], [3, 4]]
+
+        matrix = [[1, 0, 3], [0, 5, 6], [7, 8, 9]]
+        assert arrays.set_zeros(matrix, method=method) == ([0, 1], [0, 1])
+        assert matrix == [[0, 0, 0], [0, 0, 0], [0, 0, 9]]
+
+        matrix = [[1, 2, 3, 4], [5, 6, 0, 8]]
+        assert arrays.set_zeros(matrix, method=method) == ([1], [2])
+        assert matrix == [[1, 2, 0, 4], [0, 0, 0, 0]]
+
+    for _ in range(20):
+        matrix = [[random.choice([0, 1, 2, 3, 4]) for _ in range(6)] for _ in range(5)]
+        expected = [row[:] for row in matrix]
+        report = arrays.set_zeros(expected, method='markers')
+
+        assert arrays.set_zeros(matrix, method='scan') == report
+        assert matrix == expected
+
+
+def test_zero_matrix_sparse():
+    matrix = {(0, 0): 1, (0, 1): 2, (1, 0): 3, (1, 1): 4}
+    assert arrays.set_zeros_sparse(matrix, shape=(2, 2)) == ([], [])
+    assert matrix == {(0, 0): 1, (0, 1): 2, (1, 0): 3, (1, 1): 4}
+
+    matrix = {(0, 0): 1, (0, 1): 2, (0, 2): 3, (1, 0): 4, (1, 2): 6, (2, 0): 7, (2, 2): 9}
+    assert arrays.set_zeros_sparse(matrix, shape=(3, 3)) == ([1, 2], [1])
+    assert matrix == {(0, 0): 1, (0, 2): 3}
+
+    for _ in range(20):
+        dense = [[random.choice([0, 1, 2, 3, 4]) for _ in range(4)] for _ in range(5)]
+        sparse = {(i, j): v for i, row in enumerate(dense) for j, v in enumerate(row) if v}
+        sparse[0, 0] = 0  # explicit zeros are zeros too.
+        dense[0][0] = 0
+
+        report = arrays.set_zeros(dense)
+        assert arrays.set_zeros_sparse(sparse, shape=(5, 4)) == report
+        assert sparse == {(i, j): v for i, row in enumerate(dense) for j, v in enumerate(row) if v}
@@ -0,0 +1,56 @@
+import io
+import itertools
+import random
+import string
+
+import pytest
+
+from algorithmic import batch
+from algorithmic import strings
+
+
+def random_strings(n):
+    return [''.join(random.choices(string.ascii_lowercase, k=random.randint(0, 8)))
+            for _ in range(n)]
+
+
+def test_chunks():
+    assert list(batch.chunks([], 2)) == []
+    assert list(batch.chunks(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(batch.chunks(iter("abc"), 3)) == [["a", "b", "c"]]
+
+
+def test_map():
+    items = random_strings(1000)
+    expected = [strings.unique(s) for s in items]
+
+    for workers, chunk_size in [(1, 1000), (2, 7), (3, 100)]:
+        results = batch.map(strings.unique, items, workers=workers, chunk_size=chunk_size)
+        assert list(results) == expected
+
+    generator = (s for s in items)
+    assert list(batch.map(strings.is_palindrome, generator, workers=2, chunk_size=50)) == [
+        strings.is_palindrome(s) for s in items]
+
+    lines = io.StringIO("abc\naab\nxyz")  # lines keep their newline.
+    assert list(batch.map(strings.unique, lines, workers=2, chunk_size=1)) == [True, False, True]
+
+    assert list(batch.map(strings.unique, [], workers=2)) == []
+
+    with pytest.raises(ValueError):
+        list(batch.map(strings.unique, items, chunk_size=0))
+
+
+def test_starmap():
+    pairs = list(zip(random_strings(500), random_strings(500)))
+    results = batch.starmap(strings.one_away, pairs, workers=2, chunk_size=30)
+    assert list(results) == [strings.one_away(s1, s2) for s1, s2 in pairs]
+
+
+def test_map_lazy():
+    # An infinite generator can be consumed partially.
+    items = (str(i) for i in itertools.count())
+    results = batch.map(strings.unique, items, workers=2, chunk_size=10)
+
+    assert list(itertools.islice(results, 25)) == [strings.unique(str(i)) for i in range(25)]
+    results.close()
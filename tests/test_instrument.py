@@ -0,0 +1,94 @@
+import pytest
+
+from algorithmic import instrument
+from algorithmic import llists
+from algorithmic import queues
+from algorithmic import stacks
+
+
+def test_disabled():
+    push = stacks.Stack.push
+    slot = vars(llists.Node)['next']
+    assert not instrument.is_enabled()
+
+    with instrument.instrumented():
+        assert instrument.is_enabled()
+        assert stacks.Stack.push is not push
+        assert vars(llists.Node)['next'] is not slot
+        assert 'next' in vars(stacks.Node)
+
+    assert not instrument.is_enabled()
+    assert stacks.Stack.push is push
+    assert vars(llists.Node)['next'] is slot
+    assert 'next' not in vars(stacks.Node)
+
+    stack = stacks.Stack()
+    stack.push(1)
+    assert instrument.snapshot() == {}
+
+
+def test_linked_list():
+    with instrument.instrumented() as counters:
+        llist = llists.LinkedList([1, 2, 3, 4])
+        allocations = counters.snapshot()['llists.Node.allocations']
+        counters.reset()
+
+        assert len(llist) == 4
+
+    assert allocations == 4
+    assert counters.snapshot() == {'llists.LinkedList.__len__': 1}
+
+    # Nodes created while instrumented keep working after.
+    assert llist.tolist() == [1, 2, 3, 4]
+
+
+def test_stacks():
+    with instrument.instrumented() as counters:
+        stack = stacks.SetOfStacks(stack_capacity=2)
+        for i in range(5):
+            stack.push(i)
+        stack.pop()
+        stack.pop_at(0)
+
+    snapshot = counters.snapshot()
+    assert snapshot['stacks.SetOfStacks.push'] == 5
+    assert snapshot['stacks.SetOfStacks.pop'] == 1
+    assert snapshot['stacks.SetOfStacks.pop_at'] == 1
+    assert snapshot['stacks.Stack.push'] >= 5
+    assert snapshot['stacks.Node.allocations'] >= 5
+
+
+def test_queues():
+    queue = queues.QueueWithStacks()
+    for i in range(5):
+        queue.push(i)
+
+    with instrument.instrumented() as counters:
+        assert queue.pop() == 0
+
+    snapshot = counters.snapshot()
+    assert snapshot['queues.QueueWithStacks.pop'] == 1
+    assert snapshot['queues.QueueWithStacks.transfers'] == 5 + 4
+    assert snapshot['stacks.Stack.push'] == 9
+    assert snapshot['stacks.Stack.pop'] == 10
+
+    animals = queues.AnimalQueue()
+    with instrument.instrumented() as counters:
+        animals.enqueue(queues.Dog("Rex"))
+        animals.enqueue(queues.Cat("Tom"))
+        animals.dequeueAny()
+        animals.dequeue_cat()
+
+    assert counters.snapshot() == {
+        'queues.AnimalQueue.dequeueAny': 1,
+        'queues.AnimalQueue.dequeue_cat': 1,
+        'queues.AnimalQueue.enqueue': 2,
+    }
+
+
+def test_restored_on_error():
+    with pytest.raises(stacks.EmptyStackError):
+        with instrument.instrumented():
+            stacks.Stack().pop()
+
+    assert not instrument.is_enabled()
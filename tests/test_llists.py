@@ -1,3 +1,7 @@
+import io
+import random
+import sqlite3
+
 import pytest
 
 from algorithmic import llists
@@ -39,6 +43,67 @@ def test_linked_list():
     assert llist.tolist() == items[::-1]
 
 
+def test_linked_list_from_iterable():
+    for cls in [llists.LinkedList, llists.CompactLinkedList]:
+        assert cls([]).tolist() == []
+        assert cls(iter([])).tolist() == []
+        assert cls(i * i for i in range(4)).tolist() == [0, 1, 4, 9]
+        assert cls(io.StringIO("a\nb\n")).tolist() == ["a\n", "b\n"]
+
+        connection = sqlite3.connect(":memory:")
+        cursor = connection.execute("SELECT 1 UNION ALL SELECT 2")
+        assert cls(row for row, in cursor).tolist() == [1, 2]
+        connection.close()
+
+        llist = cls()
+        llist.extend(range(3))
+        llist.extend(x for x in "ab")
+        llist.extend([])
+        assert llist.tolist() == [0, 1, 2, "a", "b"]
+        assert llist.get_last().data == "b"
+        assert len(llist) == 5
+
+
+def assert_size_and_tail(llist):
+    items = llist.tolist()
+    assert len(llist) == len(items)
+
+    if items:
+        assert llist.get_last().data == items[-1]
+        assert llist.get_last().next is None
+    else:
+        assert llist.get_last() is None
+
+
+def test_size_and_tail():
+    llist = llists.LinkedList()
+    assert_size_and_tail(llist)
+
+    llist.add_items([])
+    assert_size_and_tail(llist)
+
+    llist.add_node(llists.Node("a"))
+    assert llist.head is llist.get_last()
+    assert_size_and_tail(llist)
+
+    llist.add_items(["b", "c"])
+    assert_size_and_tail(llist)
+
+    chain = llists.LinkedList(["d", "e", "f"])
+    llist.add_node(chain.head)
+    assert llist.tolist() == ["a", "b", "c", "d", "e", "f"]
+    assert_size_and_tail(llist)
+
+    llist.reverse()
+    assert_size_and_tail(llist)
+
+    llist.head = llist.at(2)
+    assert llist.tolist() == ["d", "c", "b", "a"]
+    assert_size_and_tail(llist)
+
+    assert not hasattr(llists.Node("a"), "__dict__")
+
+
 def test_remove_duplicates():
     items = ["a", "b", "b", "c", "d", "e", "e"]
     llist = llists.LinkedList(items)
@@ -47,6 +112,33 @@ def test_remove_duplicates():
 
     llists.remove_duplicates(llist)
     assert llist.tolist() == list(dict.fromkeys(items))
+    assert_size_and_tail(llist)
+
+    items = ["a", "a", "a", "b", "a", "a"]
+    llist = llists.LinkedList(items)
+    llists.remove_duplicates(llist)
+    assert llist.tolist() == ["a", "b"]
+    assert_size_and_tail(llist)
+
+    with pytest.raises(ValueError):
+        llists.remove_duplicates(llist, method='invalid')
+
+    random.seed(0)
+    items = [random.randrange(50) for _ in range(300)]
+    for method in llists.DUPLICATES_METHODS:
+        for values in [items, [], ["a"], list(range(10)), ["a"] * 10]:
+            llist = llists.LinkedList(values)
+            memory = llists.remove_duplicates(llist, method=method, chunk_size=16)
+            assert llist.tolist() == list(dict.fromkeys(values))
+            assert_size_and_tail(llist)
+            assert memory >= 0
+
+    assert llists.remove_duplicates(llists.LinkedList(items), method='runner') == 0
+
+    # The memory of the external method is bounded by the chunk size.
+    items = list(range(2000)) * 2
+    memory = llists.remove_duplicates(llists.LinkedList(items), method='external', chunk_size=100)
+    assert memory < llists.remove_duplicates(llists.LinkedList(items), method='set')
 
 
 def test_kth_to_last():
@@ -88,12 +180,17 @@ def test_delete_node():
 
     node = llist.get_node("c")
 
-    llists.delete_middle_node(node)
+    llists.delete_middle_node(node, llist)
     assert llist.tolist() == ["a", "b", "d", "e"]
+    assert_size_and_tail(llist)
+
+    llists.delete_middle_node(llist.get_node("d"), llist)
+    assert llist.tolist() == ["a", "b", "e"]
+    assert_size_and_tail(llist)
 
     with pytest.raises(ValueError):
         node = llist.get_node("e")
-        llists.delete_middle_node(node)
+        llists.delete_middle_node(node, llist)
 
 
 def test_partition():
@@ -109,6 +206,11 @@ def test_partition():
     llist = llists.partition(llist, x=5)
     output = [2, 4, 3, 6, 5, 10, 9]
     assert llist.tolist() == output
+    assert_size_and_tail(llist)
+
+    llist = llists.partition(llists.LinkedList([1, 2, 3]), x=5)
+    assert llist.tolist() == [3, 2, 1]
+    assert_size_and_tail(llist)
 
 
 def test_sum():
@@ -128,9 +230,43 @@ def test_sum():
 
     assert l3.tolist()[::-1] == [9, 1, 2]
 
+    # Forward order.
+    l3 = llists.sum(llists.LinkedList([6, 1, 7]), llists.LinkedList([2, 9, 5]), reverse=False)
+    assert l3.tolist() == [9, 1, 2]
+
+    l3 = llists.sum(llists.LinkedList([9, 9, 9]), llists.LinkedList([1]), reverse=False)
+    assert l3.tolist() == [1, 0, 0, 0]
+
+    l3 = llists.sum(llists.LinkedList([9, 9, 8]), llists.LinkedList([1]), reverse=False)
+    assert l3.tolist() == [9, 9, 9]
+
+    l3 = llists.sum(llists.LinkedList([1, 9, 9, 4]), llists.LinkedList([5, 7]), reverse=False)
+    assert l3.tolist() == [2, 0, 5, 1]
+
+    assert llists.sum(llists.LinkedList(), llists.LinkedList()).tolist() == []
+    assert llists.sum(llists.LinkedList(), llists.LinkedList([3]), reverse=False).tolist() == [3]
+
+    # More digits than the limit of int to str conversions.
+    digits = [9] * 5000
+    for reverse in [True, False]:
+        l3 = llists.sum(llists.LinkedList(digits), llists.LinkedList([1]), reverse=reverse)
+        assert l3.tolist() == ([0] * 5000 + [1] if reverse else [1] + [0] * 5000)
+
+    # Limbs.
+    base = llists.LIMB_BASE
+    a, b = 123456789987654321, 999999999000000001
+    l1 = llists.LinkedList([987654321, 123456789])
+    l2 = llists.LinkedList([1, 999999999])
+    l3 = llists.sum(l1, l2, base=base)
+    assert l3.tolist() == [(a + b) % base, (a + b) // base % base, (a + b) // base ** 2]
+
+    l3 = llists.sum(llists.LinkedList([123456789, 987654321]), llists.LinkedList([999999999, 1]),
+                    reverse=False, base=base)
+    assert l3.tolist() == [1, 123456788, 987654322]
+
 
 def test_palindrome():
-    methods = ['reverse', 'iterative', 'recursive']
+    methods = llists.PALINDROME_METHODS
 
     with pytest.raises(ValueError):
         assert llists.is_palindrome("dummy", method='invalid')
@@ -150,6 +286,21 @@ def test_palindrome():
     for method in methods:
         assert llists.is_palindrome(llist, method=method)
 
+    # The list is left unchanged.
+    for items in [[], ["a"], ["a", "b"], ["a", "a"], list("abba"), list("abca"), list("abcba")]:
+        for method in methods:
+            llist = llists.LinkedList(items)
+            tail = llist.get_last()
+
+            assert llists.is_palindrome(llist, method=method) == (items == items[::-1])
+            assert llist.tolist() == items
+            assert llist.get_last() is tail
+            assert llist.get_last() is None or llist.get_last().next is None
+
+    llist = llists.CompactLinkedList("tacocat")
+    assert llists.is_palindrome(llist)
+    assert llist.tostring() == "tacocat"
+
 
 def test_intersection():
     items = ["p", "a", "l", "i", "n", "d"]
@@ -187,6 +338,43 @@ def test_intersection():
     assert not result
     assert int_node is None
 
+    # intersection, shared suffix appended through the other list
+    l1 = llists.LinkedList([1, 2, 3])
+    l2 = llists.LinkedList([9])
+    node = l1.at(1)
+    l2.add_node(node)
+    l1.extend([4])
+    assert l2.tolist() == [9, 2, 3, 4]
+    assert l2.size_and_tail() == (4, l1.get_last())
+
+    result, int_node = llists.intersection(l1, l2)
+    assert result
+    assert int_node is node
+
+    result, int_node = llists.intersection(l2, l1)
+    assert result
+    assert int_node is node
+
+    # Appending through both lists keeps all the shared nodes.
+    l2.extend([5])
+    l1.add_node(llists.Node(6))
+    l2.add_items([7])
+    assert l1.tolist() == [1, 2, 3, 4, 5, 6, 7]
+    assert l2.tolist() == [9, 2, 3, 4, 5, 6, 7]
+    assert_size_and_tail(l2)
+
+    l1.extend([])
+    assert_size_and_tail(l1)
+
+    l2 = llists.LinkedList([9], indexed=True, skip_list=True)
+    l2.add_node(l1.at(5))
+    l1.extend([8, 9])
+    l2.extend([10])
+    assert l2.tolist() == [9, 6, 7, 8, 9, 10]
+    assert [l2.at(i).data for i in range(len(l2))] == l2.tolist()
+    assert l2.get_node(8) is l1.at(7)
+    assert_index(l2)
+
 
 def test_loop_detection():
     items = ["A", "B", "C", "D", "E"]
@@ -206,3 +394,309 @@ def test_loop_detection():
     llist = llists.LinkedList()
     node = llists.loop_detection(llist)
     assert node is None
+
+
+def test_compact_linked_list():
+    llist = llists.CompactLinkedList()
+    assert llist.tolist() == []
+    assert llist.get_node("a") is None
+    assert_size_and_tail(llist)
+
+    llist = llists.CompactLinkedList(["a", "b"])
+    assert repr(llist) == "a -> b -> None"
+    assert repr(llist.head) == "a"
+    assert llist.tostring() == "ab"
+    assert llist == llists.LinkedList(["a", "b"])
+
+    with pytest.raises(ValueError):
+        llist.at(10)
+
+    llist.add_items(["c", "d"])
+    llist.add_node(llists.Node("e"))
+    llist.add_node(llists.LinkedList(["f", "g"]).head)
+
+    # A foreign chain that loops is copied once.
+    chain = llists.LinkedList(["x", "y", "z"])
+    chain.at(2).next = chain.at(1)
+    copy = llists.CompactLinkedList()
+    copy.add_node(chain.head)
+    assert copy.tolist() == ["x", "y", "z"]
+    assert_size_and_tail(copy)
+    assert llist.tolist() == ["a", "b", "c", "d", "e", "f", "g"]
+    assert [node.data for node in llist] == llist.tolist()
+    assert_size_and_tail(llist)
+
+    # One node object per position.
+    assert llist.at(2) is llist.get_node("c")
+    assert llist.head.next.next is llist.at(2)
+
+    llist.reverse()
+    assert llist.tolist() == ["g", "f", "e", "d", "c", "b", "a"]
+    assert_size_and_tail(llist)
+
+    with pytest.raises(ValueError):
+        llist.head = llists.Node("z")
+
+    with pytest.raises(ValueError):
+        llist.head.next = llists.Node("z")
+
+    numbers = llists.CompactLinkedList(range(5), typecode='q')
+    assert numbers.tolist() == [0, 1, 2, 3, 4]
+    assert numbers._data.itemsize == 8
+
+
+def test_compact_linked_list_functions():
+    items = ["a", "b", "b", "c", "a", "e", "e"]
+    llist = llists.CompactLinkedList(items)
+    llists.remove_duplicates(llist)
+    assert llist.tolist() == ["a", "b", "c", "e"]
+    assert_size_and_tail(llist)
+
+    # Freed positions are reused.
+    llist.add_node(llists.Node("f"))
+    assert len(llist._data) == len(items)
+    assert llist.tolist() == ["a", "b", "c", "e", "f"]
+
+    llists.delete_middle_node(llist.get_node("e"), llist)
+    assert llist.tolist() == ["a", "b", "c", "f"]
+    assert_size_and_tail(llist)
+
+    llist = llists.partition(llists.CompactLinkedList([3, 5, 8, 5, 10, 2, 1]), x=5)
+    assert llist.tolist() == [1, 2, 3, 5, 8, 5, 10]
+    assert_size_and_tail(llist)
+
+    random.seed(0)
+    items = [random.randrange(50) for _ in range(300)]
+    for method in llists.DUPLICATES_METHODS:
+        for values in [items, [], ["a"], ["a"] * 10]:
+            llist = llists.CompactLinkedList(values)
+            llists.remove_duplicates(llist, method=method, chunk_size=16)
+            assert llist.tolist() == list(dict.fromkeys(values))
+            assert_size_and_tail(llist)
+
+    llist = llists.CompactLinkedList(["a", "b", "c", "d", "e"])
+    assert llists.kth_to_last(llist, k=2).data == "d"
+    assert llists.kth_to_last(llist, k=2, size=5) is llist.at(3)
+    assert llists.kth_to_last_recursive(llist.head, k=2)[0].data == "d"
+    assert llists.kth_to_last(llists.CompactLinkedList(), k=0) is None
+
+    with pytest.raises(ValueError):
+        llists.kth_to_last(llist, k=5)
+
+    with pytest.raises(ValueError):
+        llists.kth_to_last(llist, k=2, size=10)
+
+    assert llist.size_and_tail() == (5, llist.get_last())
+    assert llists.CompactLinkedList().size_and_tail() == (0, None)
+
+    for method in llists.PALINDROME_METHODS:
+        assert llists.is_palindrome(llists.CompactLinkedList("tacocat"), method=method)
+        assert not llists.is_palindrome(llists.CompactLinkedList("tacoca"), method=method)
+
+    # Nodes can't be shared between compact lists, so they never intersect.
+    l1 = llists.CompactLinkedList(["p", "a", "l", "i", "n", "d"])
+    l2 = llists.CompactLinkedList(["i", "n", "d"])
+    assert llists.intersection(l1, l2) == (False, None)
+
+    llist = llists.CompactLinkedList(["A", "B", "C", "D", "E"])
+    assert llists.loop_detection(llist) is None
+    c_node = llist.get_node("C")
+    llist.add_node(c_node)
+    assert llists.loop_detection(llist) is c_node
+
+
+def assert_index(llist):
+    expected = {}
+    for node in llist:
+        expected.setdefault(node.data, []).append(node)
+
+    assert {k: list(v) for k, v in llist._nodes_by_value.items()} == expected
+
+
+def test_indexed_linked_list():
+    for cls in [llists.LinkedList, llists.CompactLinkedList]:
+        llist = cls(["a", "b", "c", "b"], indexed=True)
+        assert llist.indexed
+        assert llist.get_node("b") is llist.at(1)
+        assert llist.get_node("z") is None
+        assert "c" in llist
+        assert "z" not in llist
+        assert_index(llist)
+
+        llist.add_items(["d", "a"])
+        llist.add_node(llists.Node("e"))
+        assert_index(llist)
+
+        llist.reverse()
+        assert llist.get_node("b") is llist.at(3)
+        assert_index(llist)
+
+        # The index is reported as the memory used.
+        assert llists.remove_duplicates(llist) > 0
+        assert llist.tolist() == ["e", "a", "d", "b", "c"]
+        assert_index(llist)
+
+        llists.delete_middle_node(llist.get_node("d"), llist)
+        assert llist.tolist() == ["e", "a", "b", "c"]
+        assert_index(llist)
+
+        llist = llists.partition(llist, x="b")
+        assert_index(llist)
+
+        llist.head = llist.at(1)
+        assert_index(llist)
+
+        llist.indexed = False
+        assert not llist.indexed
+        assert llist.get_node(llist.head.data) is llist.head
+
+        llist.indexed = True
+        assert_index(llist)
+
+    llist = llists.LinkedList(["x", "y", "x"], indexed=True)
+    llists.delete_middle_node(llist.get_node("y"), llist)
+    assert llist.tolist() == ["x", "x"]
+    assert_index(llist)
+
+    llist = llists.LinkedList(["a", "b"])
+    assert not llist.indexed
+    assert "a" in llist
+
+
+def assert_lanes(llist):
+    # Every entry of the skip list points to the node at its position.
+    lanes = llist._lanes
+    positions = {id(node): i for i, node in enumerate(llist)}
+
+    for head, tail in zip(lanes.heads, lanes.tails):
+        position, entry = -1, head
+        while entry.next is not None:
+            position += entry.width
+            entry = entry.next
+            assert positions[id(entry.node)] == position
+
+        assert entry is tail
+        assert position + entry.width == len(llist)
+
+
+def test_skip_list():
+    random.seed(0)
+
+    for cls in [llists.LinkedList, llists.CompactLinkedList]:
+        items = list(range(200))
+        llist = cls(items, skip_list=True)
+        assert llist.skip_list
+
+        assert [llist.at(i).data for i in range(len(items))] == items
+        assert_lanes(llist)
+
+        with pytest.raises(ValueError, match="out of bounds for list of size 200"):
+            llist.at(200)
+
+        with pytest.raises(ValueError):
+            llist.at(-1)
+
+        for i in range(500):
+            idx = random.randint(0, len(items))
+            action = random.choice(["insert", "delete", "append", "extend"])
+
+            if action == "insert":
+                items.insert(idx, i)
+                llist.insert(idx, i)
+            elif action == "delete" and items:
+                idx = min(idx, len(items) - 1)
+                assert llist.delete(idx) == items.pop(idx)
+            elif action == "append":
+                items.append(i)
+                llist.add_node(llists.Node(i))
+            else:
+                items.extend([i, i])
+                llist.add_items([i, i])
+
+            assert_lanes(llist)
+
+        assert llist.tolist() == items
+        assert [llist.at(i).data for i in range(len(items))] == items
+        assert_size_and_tail(llist)
+
+        llist.reverse()
+        assert llist._lanes is None
+        assert [llist.at(i).data for i in range(len(items))] == items[::-1]
+        assert_lanes(llist)
+
+        while len(llist):
+            llist.delete(0)
+
+        assert llist.head is None
+        assert_size_and_tail(llist)
+
+
+def test_insert_delete():
+    for cls in [llists.LinkedList, llists.CompactLinkedList]:
+        llist = cls(["b", "d"], indexed=True)
+        llist.insert(0, "a")
+        llist.insert(2, "c")
+        llist.insert(4, "e")
+        assert llist.tolist() == ["a", "b", "c", "d", "e"]
+        assert_size_and_tail(llist)
+
+        llist.insert(4, "a")
+        assert llist.get_node("a") is llist.head
+        assert_index(llist)
+
+        assert llist.delete(0) == "a"
+        assert llist.get_node("a") is llist.at(3)
+        assert llist.delete(4) == "e"
+        assert llist.tolist() == ["b", "c", "d", "a"]
+        assert_size_and_tail(llist)
+        assert_index(llist)
+
+        with pytest.raises(ValueError):
+            llist.insert(10, "z")
+
+        with pytest.raises(ValueError):
+            llist.delete(4)
+
+
+def test_merge_points():
+    #  a0 -> a1 -> a2 -> s0 -> s1
+    #        b0 -> b1 ----^
+    #              c0 -> a1
+    #  d0 -> d1
+    a = llists.LinkedList(["a0", "a1", "a2", "s0", "s1"])
+    b = llists.LinkedList(["b0", "b1"])
+    b.add_node(a.get_node("s0"))
+    c = llists.LinkedList(["c0"])
+    c.add_node(a.get_node("a1"))
+    d = llists.LinkedList(["d0", "d1"])
+    empty = llists.LinkedList()
+    suffix = llists.LinkedList()
+    suffix.head = a.get_node("s1")
+
+    lists = [a, empty, b, d, c, suffix]
+    groups = llists.merge_points(lists)
+    assert len(groups) == 2
+
+    shared, alone = groups
+    assert shared.tail is a.get_last()
+    assert shared.lists == [0, 2, 4, 5]
+    assert shared.merge_points == {
+        2: a.get_node("s0"),
+        4: a.get_node("a1"),
+        5: a.get_node("s1"),
+    }
+    assert alone == llists.MergeGroup(tail=d.get_last(), lists=[3])
+    assert repr(alone) == "MergeGroup(tail=d1, lists=[3], merge_points={})"
+
+    numbers = llists.LinkedList([1, 2])
+    assert repr(llists.merge_points([numbers])[0]) == (
+        "MergeGroup(tail=2, lists=[0], merge_points={})")
+
+    # Same merge point as the pairwise intersection.
+    for i in shared.merge_points:
+        assert llists.intersection(a, lists[i]) == (True, shared.merge_points[i])
+
+    looped = llists.LinkedList(["x", "y"])
+    looped.add_node(looped.head)
+    with pytest.raises(ValueError):
+        llists.merge_points([a, looped])
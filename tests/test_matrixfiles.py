@@ -0,0 +1,82 @@
+import random
+
+import pytest
+
+from algorithmic import arrays
+from algorithmic import matrixfiles
+
+
+def random_matrix(m, n, zeros=0.0):
+    return [[0 if random.random() < zeros else random.randint(1, 100) for _ in range(n)]
+            for _ in range(m)]
+
+
+def test_read_write(tmp_path):
+    path = str(tmp_path / "matrix.bin")
+
+    matrix = [[1, 2, 3], [4, 5, 6]]
+    matrixfiles.write_matrix(path, matrix)
+    assert matrixfiles.read_shape(path) == (matrixfiles.DEFAULT_TYPECODE, 2, 3)
+    assert matrixfiles.read_matrix(path) == matrix
+
+    matrix = [[1.5, 2.5], [3.5, 4.5]]
+    matrixfiles.write_matrix(path, matrix, typecode='d')
+    assert matrixfiles.read_matrix(path) == matrix
+
+    with open(path, 'wb') as f:
+        f.write(b'not a matrix file, but long enough')
+
+    with pytest.raises(matrixfiles.MatrixFileError):
+        matrixfiles.read_matrix(path)
+
+    with open(path, 'wb') as f:
+        f.write(b'short')
+
+    with pytest.raises(matrixfiles.MatrixFileError):
+        matrixfiles.read_shape(path)
+
+
+def test_rotate_matrix_file(tmp_path):
+    src = str(tmp_path / "src.bin")
+    dst = str(tmp_path / "dst.bin")
+
+    for m, n in [(1, 1), (4, 4), (5, 7), (7, 5)]:
+        matrix = random_matrix(m, n)
+        matrixfiles.write_matrix(src, matrix)
+
+        for k in range(-1, 5):
+            for block_size in [1, 2, 3, 16]:
+                matrixfiles.rotate_matrix_file(src, dst, k=k, block_size=block_size)
+
+                expected = [row[:] for row in matrix]
+                arrays.rotate_matrix(expected, k=k, method='zip')
+                assert matrixfiles.read_matrix(dst) == expected
+
+    matrixfiles.write_matrix(src, [])
+    matrixfiles.rotate_matrix_file(src, dst)
+    assert matrixfiles.read_matrix(dst) == []
+
+    # The source is not overwritten when it is also the destination.
+    matrix = [[1, 2, 3], [4, 5, 6]]
+    matrixfiles.write_matrix(src, matrix)
+    with pytest.raises(ValueError):
+        matrixfiles.rotate_matrix_file(src, str(tmp_path / "." / "src.bin"))
+
+    assert matrixfiles.read_matrix(src) == matrix
+
+
+def test_set_zeros_file(tmp_path):
+    path = str(tmp_path / "matrix.bin")
+
+    for m, n in [(1, 1), (3, 3), (6, 9), (9, 6)]:
+        for block_size in [1, 2, 16]:
+            matrix = random_matrix(m, n, zeros=0.1)
+            matrixfiles.write_matrix(path, matrix, typecode='d')
+            report = matrixfiles.set_zeros_file(path, block_size=block_size)
+
+            assert report == arrays.set_zeros(matrix)
+            assert matrixfiles.read_matrix(path) == matrix
+
+    matrixfiles.write_matrix(path, [])
+    assert matrixfiles.set_zeros_file(path) == ([], [])
+    assert matrixfiles.read_matrix(path) == []
@@ -1,7 +1,11 @@
+import io
+import mmap
 import random
 import string
 import itertools
 
+import pytest
+
 from algorithmic import strings
 
 
@@ -17,12 +21,66 @@ def test_unique():
     assert not strings.unique(s)
 
 
+def test_unique_methods():
+    with pytest.raises(ValueError):
+        strings.unique("ASDF", method='invalid')
+
+    for method in strings.UNIQUE_METHODS:
+        assert strings.unique("", method=method)
+        assert strings.unique("ASDF", method=method)
+        assert not strings.unique("AAFD", method=method)
+        assert not strings.unique("ASDFA", method=method)
+
+        s = ''.join(chr(c) for c in range(200))
+        assert not strings.unique(s, method=method)
+        assert strings.unique(s, method=method, unicode=True)
+        assert not strings.unique(s + "d", method=method, unicode=True)
+        assert strings.unique("ñandú", method=method, unicode=True)
+        assert not strings.unique("ññ", method=method, unicode=True)
+
+
+def test_unique_many():
+    s = ''.join(chr(c) for c in range(200))
+    strings_ = ["", "ASDF", "AAFD", s, "ñandú", "ññ"]
+
+    assert list(strings.unique_many(strings_)) == [strings.unique(x) for x in strings_]
+    assert list(strings.unique_many(strings_, unicode=True)) == [
+        strings.unique(x, unicode=True) for x in strings_]
+
+
 def test_check_permutation():
     assert strings.check_permutation("ABC", "CBA")
     assert not strings.check_permutation("ABC", "cBa")
     assert not strings.check_permutation("ABCD", "CBAA")
     assert not strings.check_permutation("ABCD", "ABCDF")
 
+    with pytest.raises(ValueError):
+        strings.check_permutation("ABC", "CBA", method='invalid')
+
+    for method in strings.PERMUTATION_METHODS:
+        assert strings.check_permutation("", "", method=method)
+        assert strings.check_permutation("ABCA", "CABA", method=method)
+        assert not strings.check_permutation("ABCA", "CABB", method=method)
+
+
+def test_anagram_index():
+    assert strings.signature("listen") == strings.signature("silent")
+    assert strings.signature("listen") != strings.signature("listens")
+
+    index = strings.AnagramIndex(["listen", "google", "silent", "enlist", "banana"])
+    assert len(index) == 3
+
+    assert "tinsel" in index
+    assert "inlets" in index
+    assert "goggle" not in index
+
+    assert index.anagrams("tinsel") == ["listen", "silent", "enlist"]
+    assert index.anagrams("goggle") == []
+
+    index.add("elgoog")
+    assert index.groups() == [
+        ["listen", "silent", "enlist"], ["google", "elgoog"], ["banana"]]
+
 
 def test_urlify():
     _input = bytearray('This is a test      '.encode(ENCODE_TYPE))
@@ -39,6 +97,53 @@ def test_urlify():
     assert _input == _output
 
 
+def test_percent_encoding_table():
+    table = strings.percent_encoding_table(b' /')
+    assert len(table) == 256
+    assert table[ord(' ')] == b'%20'
+    assert table[ord('/')] == b'%2F'
+    assert table[ord('a')] == b'a'
+
+
+def test_percent_encode():
+    def encode(data, **kwargs):
+        return b''.join(strings.percent_encode(data, **kwargs))
+
+    assert encode(b'This is a test') == b'This%20is%20a%20test'
+    assert encode(b'100% sure') == b'100%25%20sure'
+    assert encode(b'a/b c', escape=b'/') == b'a%2Fb c'
+    assert encode(b'a/b c', escape=b'') == b'a/b c'
+    assert encode(b'') == b''
+    assert encode(memoryview(b'a b c'), chunk_size=2) == b'a%20b%20c'
+    assert encode([b'a ', b' b']) == b'a%20%20b'
+    assert encode(io.BytesIO(b'a b' * 10), chunk_size=3) == b'a%20b' * 10
+
+    # Same contract as urlify.
+    _input = bytearray('Mr John Smith    '.encode(ENCODE_TYPE))
+    strings.urlify(_input, 13)
+    assert encode(b'Mr John Smith', escape=b' ') == _input
+
+
+def test_percent_decode():
+    def decode(data, **kwargs):
+        return b''.join(strings.percent_decode(data, **kwargs))
+
+    assert decode(b'This%20is%20a%20test') == b'This is a test'
+    assert decode(b'a%2fb%2Fc') == b'a/b/c'
+    assert decode(b'100%') == b'100%'
+    assert decode(b'100%2') == b'100%2'
+    assert decode(b'%zz%%20') == b'%zz% '
+    assert decode(b'') == b''
+
+    data = bytes(random.choices(b'ab %/\x00\xff', k=1000))
+    encoded = b''.join(strings.percent_encode(data, escape=b'% /\x00\xff'))
+
+    for chunk_size in [1, 2, 3, 7, 1024]:
+        assert decode(encoded, chunk_size=chunk_size) == data
+        assert decode(io.BytesIO(encoded), chunk_size=chunk_size) == data
+        assert decode(memoryview(encoded), chunk_size=chunk_size) == data
+
+
 def test_permutations():
     assert list(strings.permutations('AB')) == ['AB', 'BA']
     assert list(strings.permutations('A')) == ['A']
@@ -47,16 +152,115 @@ def test_permutations():
     assert list(strings.permutations('ABC')) == result
 
 
+def test_unique_permutations():
+    assert list(strings.unique_permutations('')) == ['']
+    assert list(strings.unique_permutations('A')) == ['A']
+    assert list(strings.unique_permutations('BA')) == ['AB', 'BA']
+    assert list(strings.unique_permutations('ABA')) == ['AAB', 'ABA', 'BAA']
+
+    for string_ in ['ABCD', 'AABBC', 'MISSISSIPPI'[:7]]:
+        expected = sorted(set(''.join(p) for p in itertools.permutations(string_)))
+        assert list(strings.unique_permutations(string_)) == expected
+        assert strings.count_permutations(string_) == len(expected)
+
+        for k, permutation in enumerate(expected):
+            assert strings.rank(permutation) == k
+            assert strings.unrank(string_, k) == permutation
+
+        assert list(strings.unique_permutations(string_, start=2, stop=5)) == expected[2:5]
+        assert list(strings.unique_permutations(string_, start=5, stop=2)) == []
+
+        for parts in [1, 3, 1000]:
+            ranges = strings.permutation_ranges(string_, parts)
+            assert len(ranges) == min(parts, len(expected))
+            generated = [p for r in ranges for p in strings.unique_permutations(string_, *r)]
+            assert generated == expected
+
+    with pytest.raises(ValueError):
+        strings.unrank('ABC', 6)
+
+    # The ranks can't go past the last permutation, so nothing is generated twice.
+    assert list(strings.unique_permutations('ab', 0, 2)) == ['ab', 'ba']
+    assert list(strings.unique_permutations('ab', 2)) == []
+
+    for start, stop in [(0, 5), (-1, 2), (3, None), (0, -1)]:
+        with pytest.raises(ValueError):
+            list(strings.unique_permutations('ab', start, stop))
+
+
+def test_next_permutation():
+    chars = list('ABC')
+    assert strings.next_permutation(chars)
+    assert chars == list('ACB')
+
+    chars = list('CBA')
+    assert not strings.next_permutation(chars)
+    assert chars == list('ABC')
+
+
 def test_is_palindrome():
     assert strings.is_palindrome("taco cat")
     assert strings.is_palindrome("Taco Cat")
     assert not strings.is_palindrome("not a palindrome")
+    assert strings.is_palindrome("")
+    assert strings.is_palindrome("  ")
+    assert strings.is_palindrome(" a  A")
+    assert not strings.is_palindrome("ab ")
+    assert strings.is_palindrome(b"Taco Cat")
+    assert not strings.is_palindrome(b"not a palindrome")
+
+
+def test_is_palindrome_mmap(tmp_path):
+    path = tmp_path / "text.txt"
+
+    for text, expected in [(b"Taco cats" * 1000, False), (b"Never odd or even", True)]:
+        path.write_bytes(text)
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            assert strings.is_palindrome(m) == expected
+
+
+def brute_force_palindromes(string):
+    return [
+        string[i:j] for i in range(len(string)) for j in range(i + 1, len(string) + 1)
+        if string[i:j] == string[i:j][::-1]
+    ]
+
+
+def test_palindromic_substrings():
+    assert strings.longest_palindromic_substring("") == ""
+    assert strings.longest_palindromic_substring("abc") == "a"
+    assert strings.longest_palindromic_substring("forgeeksskeegfor") == "geeksskeeg"
+    assert strings.longest_palindromic_substring("xtacocatx") == "xtacocatx"
+
+    assert strings.count_palindromic_substrings("") == 0
+    assert strings.count_palindromic_substrings("aaa") == 6
+    assert strings.count_palindromic_substrings("abc") == 3
+
+    for _ in range(200):
+        s = ''.join(random.choices("ab", k=random.randint(1, 12)))
+        palindromes = brute_force_palindromes(s)
+        longest = max(palindromes, key=len)
+
+        assert strings.count_palindromic_substrings(s) == len(palindromes)
+        assert strings.longest_palindromic_substring(s) == longest
 
 
 def test_palindrome_permutation():
     assert strings.palindrome_permutation("Tact Coa")
     assert strings.palindrome_permutation("tact coa")
     assert not strings.palindrome_permutation("not a palindrome permutation")
+    assert strings.palindrome_permutation("")
+    assert strings.palindrome_permutation("Aa b")
+    assert not strings.palindrome_permutation("Ab")
+
+    text = "Tact Coa" * 1001
+    for chunk_size in [1, 3, 1024]:
+        assert strings.palindrome_permutation(text, chunk_size=chunk_size)
+        assert strings.palindrome_permutation(io.StringIO(text), chunk_size=chunk_size)
+        assert not strings.palindrome_permutation(text + "xy", chunk_size=chunk_size)
+
+    assert strings.palindrome_permutation(["Tact", " ", "Coa"])
+    assert not strings.palindrome_permutation(["Tact", " ", "Cob"])
 
 
 def test_one_away():
@@ -71,10 +275,118 @@ def test_one_away():
     assert not strings.one_away("bale", "pales")
 
 
+def test_one_away_repeated_characters():
+    assert strings.one_away("aab", "ab")
+    assert strings.one_away("ab", "aab")
+    assert strings.one_away("abca", "aca")
+    assert not strings.one_away("abca", "bcb")
+    assert not strings.one_away("aabb", "bba")
+    assert strings.one_away("", "a")
+    assert strings.one_away("", "")
+
+
+def levenshtein(s1, s2):
+    if not s1 or not s2:
+        return len(s1) + len(s2)
+
+    return min(
+        levenshtein(s1[1:], s2[1:]) + (s1[0] != s2[0]),
+        levenshtein(s1[1:], s2) + 1,
+        levenshtein(s1, s2[1:]) + 1,
+    )
+
+
+def test_edit_distance():
+    assert strings.edit_distance("kitten", "sitting") == 3
+    assert strings.edit_distance("", "abc") == 3
+    assert strings.edit_distance("abc", "") == 3
+    assert strings.edit_distance("kitten", "sitting", max_distance=2) == 3
+    assert strings.edit_distance("kitten", "kitten", max_distance=0) == 0
+    assert strings.edit_distance("a", "abcdef", max_distance=2) == 3
+
+    for _ in range(200):
+        s1 = ''.join(random.choices("abc", k=random.randint(0, 6)))
+        s2 = ''.join(random.choices("abc", k=random.randint(0, 6)))
+        distance = levenshtein(s1, s2)
+
+        assert strings.edit_distance(s1, s2) == distance
+        for k in range(4):
+            assert strings.edit_distance(s1, s2, max_distance=k) == min(distance, k + 1)
+            assert strings.within_k_edits(s1, s2, k) == (distance <= k)
+
+        assert strings.one_away(s1, s2) == (distance <= 1)
+
+
+def test_bk_tree():
+    tree = strings.BKTree()
+    assert tree.search("book", 2) == []
+
+    words = ["book", "books", "cake", "boo", "cape", "cart", "boon", "cook", "book"]
+    tree = strings.BKTree(words)
+    assert len(tree) == 8
+
+    assert tree.search("book", 0) == [("book", 0)]
+    assert tree.search("bok", 1) == [("boo", 1), ("book", 1)]
+    assert tree.search("cape", 1) == [("cape", 0), ("cake", 1)]
+
+    for query in ["boko", "cat", "x", "caper"]:
+        for k in range(4):
+            expected = sorted(
+                (word, levenshtein(query, word)) for word in set(words)
+                if levenshtein(query, word) <= k
+            )
+            assert sorted(tree.search(query, k)) == expected
+
+
 def test_compression():
     assert strings.compression("AABCCCCCAAA") == "A2B1C5A3"
     assert strings.compression("ABBACCC") == "A1B2A1C3"
     assert strings.compression("AA") == "AA"
+    assert strings.compression("") == ""
+
+
+def test_runs():
+    assert list(strings.runs("")) == []
+    assert list(strings.runs("AABCCC")) == [("A", 2), ("B", 1), ("C", 3)]
+    assert list(strings.runs("AABCCC", chunk_size=1)) == [("A", 2), ("B", 1), ("C", 3)]
+    assert list(strings.runs(["AA", "AB", "B"])) == [("A", 3), ("B", 2)]
+    assert list(strings.runs(b"\n\nxx")) == [(b"\n", 2), (b"x", 2)]
+    assert list(strings.runs(io.BytesIO(b"aab"), chunk_size=2)) == [(b"a", 2), (b"b", 1)]
+
+
+def test_rle():
+    def encode(data, **kwargs):
+        buffer = io.BytesIO()
+        strings.rle_encode(data, buffer, **kwargs)
+        return buffer.getvalue()
+
+    def decode(data, text=False, **kwargs):
+        buffer = io.StringIO() if text else io.BytesIO()
+        strings.rle_decode(data, buffer, text=text, **kwargs)
+        return buffer.getvalue()
+
+    assert encode("") == b""
+    assert encode("AAB") == b"A\x02B\x01"
+    assert encode(b"A" * 300) == b"A\xac\x02"
+    assert encode("é" * 3) == "é".encode('utf-8') + b"\x03"
+
+    assert decode(b"A\x02B\x01", text=True) == "AAB"
+    assert decode(b"A\xac\x02") == b"A" * 300
+
+    with pytest.raises(ValueError):
+        decode(b"A\xac")
+
+    text = ''.join(c * random.randint(1, 300) for c in random.choices("ab€ñ\n😀", k=200))
+    data = text.encode('utf-8')
+
+    for chunk_size in [1, 2, 5, 4096]:
+        encoded = encode(text, chunk_size=chunk_size)
+        assert len(encoded) < len(data)
+        assert decode(encoded, text=True, chunk_size=chunk_size) == text
+        assert decode(io.BytesIO(encoded), text=True, chunk_size=chunk_size) == text
+
+        encoded = encode(io.BytesIO(data), chunk_size=chunk_size)
+        assert decode(encoded, chunk_size=chunk_size) == data
 
 
 def test_rotation():
@@ -83,3 +395,37 @@ def test_rotation():
 
     assert not strings.rotation("waterbottle", "w")
     assert not strings.rotation("", "")
+
+
+def test_rotation_with_repeated_characters():
+    assert strings.rotation("aab", "aba")
+    assert strings.rotation("aab", "baa")
+    assert not strings.rotation("aab", "abb")
+    assert strings.rotation("abab", "baba")
+    assert strings.rotation("a", "a")
+
+    for _ in range(200):
+        s1 = ''.join(random.choices("ab", k=random.randint(1, 8)))
+        s2 = ''.join(random.choices("ab", k=len(s1)))
+        assert strings.rotation(s1, s2) == (s1 in s2 + s2)
+
+
+def test_minimal_rotation():
+    assert strings.minimal_rotation("") == 0
+    assert strings.minimal_rotation("a") == 0
+    assert strings.minimal_rotation("bca") == 2
+    assert strings.canonical_rotation("erbottlewat") == "aterbottlew"
+    assert strings.canonical_rotation("") == ""
+
+    for _ in range(200):
+        s = ''.join(random.choices("abc", k=random.randint(1, 10)))
+        assert strings.canonical_rotation(s) == min(s[i:] + s[:i] for i in range(len(s)))
+
+
+def test_group_rotations():
+    groups = strings.group_rotations(["abc", "bca", "acb", "cab", "bac", "x"])
+    assert groups == {
+        "abc": ["abc", "bca", "cab"],
+        "acb": ["acb", "bac"],
+        "x": ["x"],
+    }